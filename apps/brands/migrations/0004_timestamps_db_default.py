@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0003_add_gps_coordinates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='brand',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='brand',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+    ]
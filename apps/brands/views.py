@@ -11,7 +11,12 @@ from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
 from apps.core.pagination import SmallPagination, StandardPagination
-from apps.core.permissions import BrandAccessMixin, HasBrandAccess, IsBrandManager
+from apps.core.permissions import (
+    BrandAccessMixin,
+    HasBrandAccess,
+    IsBrandManager,
+    get_accessible_brand_ids,
+)
 
 from .models import Brand, Location
 from .resources import LocationResource
@@ -324,7 +329,7 @@ Import multiple locations from a spreadsheet file (CSV, XLSX, or XLS).
                 # Optionally enforce that all rows match this brand
                 # For now, just validate access
                 if request.user.role != "admin":
-                    if not request.user.brands.filter(id=brand_id).exists():
+                    if brand.id not in get_accessible_brand_ids(request):
                         return Response(
                             {"error": "You do not have access to this brand."},
                             status=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,21 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Enable pg_trgm and index template names for fast substring search."""
+
+    dependencies = [
+        ("campaigns", "0002_add_html_email_fields"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="campaigntemplate",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="tmpl_name_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
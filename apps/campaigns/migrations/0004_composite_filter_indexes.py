@@ -0,0 +1,32 @@
+# Generated by Django 5.2.17 on 2026-08-31 18:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0003_add_gps_coordinates'),
+        ('campaigns', '0003_template_name_trgm_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaigntemplate',
+            index=models.Index(fields=['brand', 'is_active'], name='campaign_te_brand_i_29b14e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaigntemplate',
+            index=models.Index(fields=['brand', 'campaign_type'], name='campaign_te_brand_i_e99125_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationcampaign',
+            index=models.Index(fields=['template', 'status'], name='location_ca_templat_97316f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locationcampaign',
+            index=models.Index(fields=['status', '-created_at'], name='location_ca_status_f7ffdb_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-31 18:45
+
+import pgvector.django.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('brands', '0003_add_gps_coordinates'),
+        ('campaigns', '0005_campaign_embedding_hnsw_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='locationcampaign',
+            name='campaign_embedding_hnsw',
+        ),
+        migrations.AddIndex(
+            model_name='locationcampaign',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['content_embedding'], m=16, name='campaign_embedding_hnsw', opclasses=['vector_ip_ops']),
+        ),
+    ]
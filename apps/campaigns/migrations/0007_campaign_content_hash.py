@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0006_embedding_hnsw_inner_product'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationcampaign',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
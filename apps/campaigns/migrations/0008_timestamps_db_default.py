@@ -0,0 +1,52 @@
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0007_campaign_content_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='campaigntemplate',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='campaigntemplate',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='locationcampaign',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='locationcampaign',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='approvalstep',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='approvalstep',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='emailrecipient',
+            name='created_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='emailrecipient',
+            name='updated_at',
+            field=models.DateTimeField(db_default=Now(), editable=False),
+        ),
+    ]
@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django_fsm import FSMField, transition
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
 
 from apps.core.models import TimeStampedModel, UUIDModel
 
@@ -50,6 +51,13 @@ class CampaignTemplate(UUIDModel, TimeStampedModel):
     class Meta:
         db_table = "campaign_templates"
         ordering = ["brand", "name"]
+        indexes = [
+            # Trigram index so name search (icontains) avoids a sequential scan
+            GinIndex(fields=["name"], name="tmpl_name_trgm", opclasses=["gin_trgm_ops"]),
+            # Composite indexes for the list endpoint's filter combinations
+            models.Index(fields=["brand", "is_active"]),
+            models.Index(fields=["brand", "campaign_type"]),
+        ]
 
     def __str__(self):
         return f"{self.brand.name} - {self.name}"
@@ -119,9 +127,18 @@ class LocationCampaign(UUIDModel, TimeStampedModel):
     email_subject = models.CharField(max_length=255, blank=True)
     email_preview_text = models.CharField(max_length=255, blank=True)
 
-    # Vector embedding for semantic search (1536 dimensions for OpenAI embeddings)
+    # Vector embedding for semantic search (1536 dimensions for OpenAI embeddings).
+    # Stored as full-precision vector: halfvec (fp16) would halve row and index
+    # size, and bit/int8 quantization shrink further, but all of them need
+    # pgvector >= 0.7 everywhere, which the deployments don't guarantee yet.
     content_embedding = VectorField(dimensions=1536, null=True, blank=True)
 
+    # SHA-256 hex digest of generated_content at the time the embedding was
+    # computed. Bulk embedding compares it against the current content and
+    # skips campaigns whose text has not changed, so re-seeding unchanged
+    # data never reaches the embeddings API.
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+
     # Scheduling
     scheduled_start = models.DateTimeField(null=True, blank=True)
     scheduled_end = models.DateTimeField(null=True, blank=True)
@@ -134,6 +151,19 @@ class LocationCampaign(UUIDModel, TimeStampedModel):
         indexes = [
             models.Index(fields=["location", "status"]),
             models.Index(fields=["status", "scheduled_start"]),
+            models.Index(fields=["template", "status"]),
+            models.Index(fields=["status", "-created_at"]),
+            # ANN index so similarity search is an indexed top-k lookup
+            # instead of a sequential scan over every embedding. Embeddings
+            # are unit-length at write time, so inner product gives cosine
+            # ordering without per-comparison norm computation.
+            HnswIndex(
+                name="campaign_embedding_hnsw",
+                fields=["content_embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_ip_ops"],
+            ),
         ]
 
     def __str__(self):
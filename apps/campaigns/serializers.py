@@ -26,6 +26,25 @@ class CampaignTemplateListSerializer(serializers.ModelSerializer):
         return obj.location_campaigns.count()
 
 
+class CampaignTemplateListValuesSerializer(serializers.Serializer):
+    """
+    List serializer fed from a values() queryset.
+
+    Mirrors CampaignTemplateListSerializer's output but works on plain
+    dict rows with an annotated campaign count, so listing skips per-row
+    model instantiation and the per-template count query.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    brand = serializers.UUIDField(read_only=True)
+    brand_name = serializers.CharField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    campaign_type = serializers.CharField(read_only=True)
+    is_active = serializers.BooleanField(read_only=True)
+    campaign_count = serializers.IntegerField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
 class CampaignTemplateDetailSerializer(serializers.ModelSerializer):
     """Serializer for campaign template detail view."""
 
@@ -129,6 +148,26 @@ class LocationCampaignListSerializer(serializers.ModelSerializer):
         ]
 
 
+class LocationCampaignListValuesSerializer(serializers.Serializer):
+    """
+    List serializer fed from a values() queryset.
+
+    Mirrors LocationCampaignListSerializer's output but works on plain
+    dict rows, skipping per-row model instantiation on the hot list path.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    location = serializers.UUIDField(read_only=True)
+    location_name = serializers.CharField(read_only=True)
+    template = serializers.UUIDField(read_only=True)
+    template_name = serializers.CharField(read_only=True)
+    brand_name = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    scheduled_start = serializers.DateTimeField(read_only=True, allow_null=True)
+    scheduled_end = serializers.DateTimeField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
 class LocationCampaignDetailSerializer(serializers.ModelSerializer):
     """Serializer for location campaign detail view."""
 
@@ -189,6 +228,11 @@ class LocationCampaignDetailSerializer(serializers.ModelSerializer):
         return bool(obj.generated_html_email)
 
     def get_email_recipient_count(self, obj):
+        # Prefer the queryset annotation; fall back to a COUNT query when
+        # the instance was loaded outside the viewset
+        total = getattr(obj, "email_recipient_total", None)
+        if total is not None:
+            return total
         return obj.email_recipients.count()
 
 
@@ -219,6 +263,40 @@ class LocationCampaignCreateUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class ContentGenerationSerializer(serializers.Serializer):
+    """Serializer for content generation options."""
+
+    use_ai = serializers.BooleanField(default=True)
+    additional_instructions = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True, default=None
+    )
+    async_generation = serializers.BooleanField(default=False)
+
+
+class SimilarCampaignQuerySerializer(serializers.Serializer):
+    """Serializer for similar_to query parameters."""
+
+    limit = serializers.IntegerField(default=5, min_value=1, max_value=50)
+    threshold = serializers.FloatField(default=0.7, min_value=0.0, max_value=1.0)
+    same_brand = serializers.BooleanField(default=False)
+
+
+class SimilarSearchRequestSerializer(serializers.Serializer):
+    """Serializer for the similarity search request body."""
+
+    query = serializers.CharField(required=False, allow_blank=True, default="")
+    campaign_id = serializers.UUIDField(required=False, allow_null=True, default=None)
+    limit = serializers.IntegerField(default=10, min_value=1, max_value=50)
+    similarity_threshold = serializers.FloatField(
+        default=0.7, min_value=0.0, max_value=1.0
+    )
+    brand_id = serializers.UUIDField(required=False, allow_null=True, default=None)
+    same_brand_only = serializers.BooleanField(default=False)
+    status_filter = serializers.ListField(
+        child=serializers.CharField(), required=False, allow_null=True, default=None
+    )
+
+
 class CampaignActionSerializer(serializers.Serializer):
     """Serializer for campaign workflow actions."""
 
@@ -8,17 +8,98 @@ This service handles:
 """
 
 import logging
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from django.conf import settings
-from jinja2 import BaseLoader, Environment, TemplateSyntaxError, UndefinedError
+from jinja2 import BaseLoader, Environment, TemplateSyntaxError, Undefined, UndefinedError, meta
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
 logger = logging.getLogger(__name__)
 
 
+class SilentUndefined(Undefined):
+    """Undefined that renders as an empty string instead of raising."""
+
+    def _fail_with_undefined_error(self, *args, **kwargs):
+        return ""
+
+    __add__ = __radd__ = __mul__ = __rmul__ = __div__ = __rdiv__ = \
+    __truediv__ = __rtruediv__ = __floordiv__ = __rfloordiv__ = \
+    __mod__ = __rmod__ = __pos__ = __neg__ = __call__ = \
+    __getitem__ = __lt__ = __le__ = __gt__ = __ge__ = __int__ = \
+    __float__ = __complex__ = __pow__ = __rpow__ = \
+    _fail_with_undefined_error
+
+    def __str__(self):
+        return ""
+
+    def __repr__(self):
+        return ""
+
+    def __bool__(self):
+        return False
+
+
+# Shared Jinja environments. Environment construction and template
+# compilation are pure CPU work on identical inputs, so both are hoisted
+# to module scope and the compiled templates memoized by source string.
+_jinja_env = Environment(loader=BaseLoader())
+_safe_jinja_env = Environment(loader=BaseLoader(), undefined=SilentUndefined)
+
+
+@lru_cache(maxsize=512)
+def _compile_template(source: str):
+    """Compile a template in the strict environment, cached by source."""
+    return _jinja_env.from_string(source)
+
+
+@lru_cache(maxsize=512)
+def _compile_template_safe(source: str):
+    """Compile a template in the lenient environment, cached by source."""
+    return _safe_jinja_env.from_string(source)
+
+
+@lru_cache(maxsize=1024)
+def _validate_template_cached(source: str) -> tuple[bool, tuple[str, ...], str | None]:
+    """
+    Parse a template and extract its variables, cached by source.
+
+    Pure string parsing that repeats heavily during editor previews, so the
+    result is memoized as an immutable tuple.
+    """
+    try:
+        ast = _jinja_env.parse(source)
+        variables = meta.find_undeclared_variables(ast)
+        return True, tuple(sorted(variables)), None
+    except TemplateSyntaxError as e:
+        return False, (), str(e)
+
+
+# Cap on concurrent outbound OpenAI calls per process. Keeps a burst of
+# requests or Celery tasks from stampeding the provider's rate limits
+# while still pipelining several calls at once.
+LLM_MAX_CONCURRENT_CALLS = 10
+LLM_CALL_GATE = threading.BoundedSemaphore(LLM_MAX_CONCURRENT_CALLS)
+
+
+# Default sample data for template previews; read-only so it can be shared.
+DEFAULT_PREVIEW_CONTEXT = MappingProxyType({
+    "brand_name": "Sample Brand",
+    "location_name": "Downtown Store",
+    "store_number": "001",
+    "full_address": "123 Main St, Austin, TX 78701",
+    "city": "Austin",
+    "state": "TX",
+    "street": "123 Main St",
+    "zip": "78701",
+})
+
+
 @dataclass
 class GenerationResult:
     """Result of content generation, tracking whether AI was actually used."""
@@ -86,12 +167,26 @@ Examples of Similar Successful Campaigns:
         """4. Learn from the similar campaign examples to match the successful style and tone"""
     )
 
+    PREVIEW_PROMPT = """Generate a sample marketing content based on this template:
+
+Template:
+{content_template}
+
+Sample Context:
+- Brand: {brand_name}
+- Location: {location_name}
+- Store Number: {store_number}
+- Address: {full_address}
+
+Generate polished, ready-to-use marketing content following the template structure.
+Only output the final content, no explanations."""
+
     def __init__(self):
         """Initialize the content generator with LangChain components."""
         self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', None)
         self._llm = None
         self._embeddings = None
-        self._jinja_env = Environment(loader=BaseLoader())
+        self._jinja_env = _jinja_env
 
     @property
     def llm(self) -> ChatOpenAI:
@@ -103,6 +198,10 @@ Examples of Similar Successful Campaigns:
                 model="gpt-4o-mini",
                 temperature=0.7,
                 max_tokens=1000,
+                # Bound each call so a stuck provider request cannot pin a
+                # worker indefinitely.
+                timeout=20,
+                max_retries=3,
                 openai_api_key=self.openai_api_key,
             )
         return self._llm
@@ -115,6 +214,8 @@ Examples of Similar Successful Campaigns:
                 raise ValueError("OPENAI_API_KEY is not configured")
             self._embeddings = OpenAIEmbeddings(
                 model="text-embedding-3-small",
+                timeout=20,
+                max_retries=3,
                 openai_api_key=self.openai_api_key,
             )
         return self._embeddings
@@ -175,7 +276,7 @@ Examples of Similar Successful Campaigns:
             ValueError: If template rendering fails
         """
         try:
-            template = self._jinja_env.from_string(template_content)
+            template = _compile_template(template_content)
             rendered = template.render(**context)
             return rendered.strip()
         except TemplateSyntaxError as e:
@@ -201,31 +302,7 @@ Examples of Similar Successful Campaigns:
             Rendered template string (may have empty placeholders)
         """
         try:
-            # Configure environment to be lenient with undefined vars
-            from jinja2 import BaseLoader, Environment, Undefined
-
-            class SilentUndefined(Undefined):
-                def _fail_with_undefined_error(self, *args, **kwargs):
-                    return ""
-
-                __add__ = __radd__ = __mul__ = __rmul__ = __div__ = __rdiv__ = \
-                __truediv__ = __rtruediv__ = __floordiv__ = __rfloordiv__ = \
-                __mod__ = __rmod__ = __pos__ = __neg__ = __call__ = \
-                __getitem__ = __lt__ = __le__ = __gt__ = __ge__ = __int__ = \
-                __float__ = __complex__ = __pow__ = __rpow__ = \
-                _fail_with_undefined_error
-
-                def __str__(self):
-                    return ""
-
-                def __repr__(self):
-                    return ""
-
-                def __bool__(self):
-                    return False
-
-            safe_env = Environment(loader=BaseLoader(), undefined=SilentUndefined)
-            template = safe_env.from_string(template_content)
+            template = _compile_template_safe(template_content)
             rendered = template.render(**context)
             return rendered.strip()
         except TemplateSyntaxError as e:
@@ -339,7 +416,8 @@ Examples of Similar Successful Campaigns:
                 HumanMessage(content=user_prompt),
             ]
 
-            response = self.llm.invoke(messages)
+            with LLM_CALL_GATE:
+                response = self.llm.invoke(messages)
             generated_content = response.content.strip()
 
             logger.info(
@@ -418,17 +496,24 @@ Examples of Similar Successful Campaigns:
             content: Text content to embed
 
         Returns:
-            List of floats representing the embedding vector (1536 dimensions)
+            List of floats representing the unit-normalized embedding
+            vector (1536 dimensions)
 
         Raises:
             ValueError: If OpenAI API is not configured
         """
+        # Imported here because similarity_search imports this module.
+        from .similarity_search import normalize_vector
+
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY is not configured for embeddings")
 
         try:
-            embedding = self.embeddings.embed_query(content)
-            return embedding
+            with LLM_CALL_GATE:
+                embedding = self.embeddings.embed_query(content)
+            # Stored vectors must be unit length — the HNSW index and
+            # searches use max inner product on that invariant.
+            return normalize_vector(embedding)
         except Exception as e:
             logger.exception(f"Embedding generation failed: {e}")
             raise
@@ -479,25 +564,12 @@ Examples of Similar Successful Campaigns:
                 - variables: list of variable names found
                 - error: error message if invalid
         """
-        try:
-            # Parse the template
-            ast = self._jinja_env.parse(template_content)
-
-            # Extract variable names using undeclared_variables
-            from jinja2 import meta
-            variables = meta.find_undeclared_variables(ast)
-
-            return {
-                "valid": True,
-                "variables": sorted(list(variables)),
-                "error": None,
-            }
-        except TemplateSyntaxError as e:
-            return {
-                "valid": False,
-                "variables": [],
-                "error": str(e),
-            }
+        valid, variables, error = _validate_template_cached(template_content)
+        return {
+            "valid": valid,
+            "variables": list(variables),
+            "error": error,
+        }
 
     def preview_content(
         self,
@@ -517,18 +589,46 @@ Examples of Similar Successful Campaigns:
             Rendered preview string
         """
         if sample_context is None:
-            sample_context = {
-                "brand_name": "Sample Brand",
-                "location_name": "Downtown Store",
-                "store_number": "001",
-                "full_address": "123 Main St, Austin, TX 78701",
-                "city": "Austin",
-                "state": "TX",
-                "street": "123 Main St",
-                "zip": "78701",
-            }
-
-        return self.render_template_safe(template_content, sample_context)
+            sample_context = DEFAULT_PREVIEW_CONTEXT
+
+        return self.render_template_safe(template_content, dict(sample_context))
+
+    def generate_preview(
+        self,
+        template_content: str,
+        sample_context: dict[str, Any],
+    ) -> str:
+        """
+        Generate an AI sample rendering of a template.
+
+        Used by the preview endpoint and its background task.
+
+        Args:
+            template_content: Jinja2 template string
+            sample_context: Sample data to describe in the prompt
+
+        Returns:
+            AI-generated preview string
+
+        Raises:
+            ValueError: If OpenAI API is not configured
+        """
+        prompt = self.PREVIEW_PROMPT.format(
+            content_template=template_content,
+            brand_name=sample_context.get("brand_name"),
+            location_name=sample_context.get("location_name"),
+            store_number=sample_context.get("store_number"),
+            full_address=sample_context.get("full_address"),
+        )
+
+        messages = [
+            SystemMessage(content=self.SYSTEM_PROMPT),
+            HumanMessage(content=prompt),
+        ]
+
+        with LLM_CALL_GATE:
+            response = self.llm.invoke(messages)
+        return response.content.strip()
 
     # ========== HTML Email Generation Methods ==========
 
@@ -705,7 +805,8 @@ Subject Line:"""
                 HumanMessage(content=prompt),
             ]
 
-            response = self.llm.invoke(messages)
+            with LLM_CALL_GATE:
+                response = self.llm.invoke(messages)
             html_content = response.content.strip()
 
             # Clean up any markdown code blocks if present
@@ -763,7 +864,8 @@ Subject Line:"""
                 HumanMessage(content=prompt),
             ]
 
-            response = self.llm.invoke(messages)
+            with LLM_CALL_GATE:
+                response = self.llm.invoke(messages)
             subject = response.content.strip()
 
             # Remove quotes if present
@@ -843,3 +945,20 @@ Subject Line:"""
             "subject": subject,
             "preview_text": preview_text,
         }
+
+
+# Process-wide service instance. Constructing the LangChain clients
+# (HTTP connection pool, tokenizer) is expensive, so request handlers and
+# tasks share one lazily built instance instead of creating one per call.
+_service: ContentGeneratorService | None = None
+_service_lock = threading.Lock()
+
+
+def get_content_generator_service() -> ContentGeneratorService:
+    """Return the shared ContentGeneratorService instance."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ContentGeneratorService()
+    return _service
@@ -0,0 +1,59 @@
+"""
+Content-addressed cache for embedding vectors.
+
+Embeddings are a pure function of (model name, text), so vectors are
+cached in Redis under a digest of both. Re-embedding unchanged campaign
+content then costs a cache read instead of a model API round-trip.
+"""
+
+import hashlib
+from collections.abc import Callable, Sequence
+
+from django.core.cache import cache
+
+# Key namespace, bump the version to invalidate all cached vectors
+EMBED_CACHE_PREFIX = "embed:v1"
+
+# Campaign content changes rarely; a week bounds stale-entry buildup
+# while keeping the steady-state hit rate high.
+EMBED_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def cache_key(model_name: str, text: str) -> str:
+    """Return the content-addressed cache key for a (model, text) pair."""
+    digest = hashlib.sha256(f"{model_name}\x00{text}".encode()).hexdigest()
+    return f"{EMBED_CACHE_PREFIX}:{digest}"
+
+
+def get_or_compute_many(
+    texts: Sequence[str],
+    model_name: str,
+    embed_batch: Callable[[list[str]], list[list[float]]],
+) -> list[list[float]]:
+    """
+    Return one embedding vector per text, computing only cache misses.
+
+    Args:
+        texts: Texts to embed, in order
+        model_name: Embedding model identifier, part of the cache key
+        embed_batch: Called once with the list of miss texts; must return
+            one vector per text in the same order
+
+    Returns:
+        Vectors aligned with ``texts``
+    """
+    keys = [cache_key(model_name, text) for text in texts]
+    cached = cache.get_many(keys)
+
+    vectors: list[list[float] | None] = [cached.get(key) for key in keys]
+    miss_indices = [i for i, vector in enumerate(vectors) if vector is None]
+
+    if miss_indices:
+        computed = embed_batch([texts[i] for i in miss_indices])
+        to_store = {}
+        for i, vector in zip(miss_indices, computed, strict=True):
+            vectors[i] = vector
+            to_store[keys[i]] = vector
+        cache.set_many(to_store, timeout=EMBED_CACHE_TIMEOUT)
+
+    return vectors
@@ -7,19 +7,53 @@ This service enables:
 - RAG context retrieval for content generation
 """
 
+import hashlib
 import logging
+import math
+import threading
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from typing import Any
 
 from django.conf import settings
-from django.db.models import F, Value
+from django.db import connection, transaction
+from django.db.models import F, Q, Value
 from django.db.models.functions import Coalesce
 from langchain_openai import OpenAIEmbeddings
-from pgvector.django import CosineDistance
+from pgvector.django import MaxInnerProduct
+
+from . import embed_cache
+from .content_generator import LLM_CALL_GATE
 
 logger = logging.getLogger(__name__)
 
 
+def content_digest(text: str) -> str:
+    """
+    Hex digest of campaign content, stored alongside its embedding.
+
+    Comparing the stored digest against the current content tells bulk
+    embedding which campaigns actually changed, without fetching or
+    recomputing any vectors.
+    """
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def normalize_vector(vector: list[float]) -> list[float]:
+    """
+    Scale a vector to unit length.
+
+    Embeddings are normalized once at write time so similarity queries can
+    use inner product, which skips the per-comparison norm computation that
+    cosine distance pays. OpenAI embeddings already arrive unit-length, so
+    this is a cheap invariant check for vectors from other sources.
+    """
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return vector
+    return [x / norm for x in vector]
+
+
 @dataclass
 class SimilarCampaign:
     """Represents a similar campaign result with distance score."""
@@ -58,6 +92,35 @@ class SimilaritySearchService:
     # Maximum content preview length
     CONTENT_PREVIEW_LENGTH = 200
 
+    # Campaigns embedded per model call during bulk computation
+    EMBED_BATCH_SIZE = 64
+
+    # Model identifier, also part of the embedding cache key
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
+    # HNSW search beam width; larger finds more candidates at higher cost
+    # (pgvector defaults to 40, pinned here so tuning is explicit)
+    HNSW_EF_SEARCH = 40
+
+    # Recomputes touching more rows than this drop the HNSW index for the
+    # duration of the write and rebuild it once at the end: every indexed
+    # UPDATE mutates the graph, which is far slower than one build over
+    # the finished table.
+    DEFERRED_INDEX_THRESHOLD = 5000
+
+    # Runs writing back at least this many rows stream them through COPY
+    # into a temp table plus one joined UPDATE, instead of parameterized
+    # bulk_update statements binding ~6KB of vector text per row.
+    COPY_WRITE_THRESHOLD = 1000
+
+    # Must stay in sync with the HnswIndex on LocationCampaign.Meta
+    HNSW_INDEX_NAME = "campaign_embedding_hnsw"
+    HNSW_INDEX_DDL = (
+        "CREATE INDEX {concurrently}IF NOT EXISTS campaign_embedding_hnsw "
+        "ON location_campaigns USING hnsw (content_embedding vector_ip_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
     def __init__(self):
         """Initialize the similarity search service."""
         self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', None)
@@ -70,7 +133,9 @@ class SimilaritySearchService:
             if not self.openai_api_key:
                 raise ValueError("OPENAI_API_KEY is not configured")
             self._embeddings = OpenAIEmbeddings(
-                model="text-embedding-3-small",
+                model=self.EMBEDDING_MODEL,
+                timeout=20,
+                max_retries=3,
                 openai_api_key=self.openai_api_key,
             )
         return self._embeddings
@@ -89,8 +154,9 @@ class SimilaritySearchService:
             raise ValueError("Cannot generate embedding for empty text")
 
         try:
-            embedding = self.embeddings.embed_query(text)
-            return embedding
+            with LLM_CALL_GATE:
+                embedding = self.embeddings.embed_query(text)
+            return normalize_vector(embedding)
         except Exception as e:
             logger.exception(f"Failed to generate embedding: {e}")
             raise
@@ -123,9 +189,16 @@ class SimilaritySearchService:
         if similarity_threshold is None:
             similarity_threshold = self.DEFAULT_SIMILARITY_THRESHOLD
 
-        # Build queryset with filters
+        # Build queryset with filters. only() keeps the result rows narrow:
+        # without it every hit drags its own 1536-float embedding back.
         queryset = LocationCampaign.objects.select_related(
             "location", "location__brand", "template"
+        ).only(
+            "id",
+            "generated_content",
+            "location__name",
+            "location__brand__name",
+            "template__name",
         ).filter(
             content_embedding__isnull=False,
         )
@@ -140,38 +213,47 @@ class SimilaritySearchService:
         if status_filter:
             queryset = queryset.filter(status__in=status_filter)
 
-        # Annotate with cosine distance
-        # CosineDistance returns distance (0 = identical, 2 = opposite)
-        # We want similarity, so we'll calculate it as 1 - (distance/2)
+        # Annotate with negative inner product (pgvector's <#>). Vectors
+        # are unit-length at write time, so -<#> equals cosine similarity
+        # while skipping the norm computation cosine distance pays per row.
         queryset = queryset.annotate(
-            distance=CosineDistance("content_embedding", query_embedding)
+            distance=MaxInnerProduct("content_embedding", query_embedding)
         ).order_by("distance")
 
-        # Filter by threshold (convert similarity to distance)
-        # For cosine: distance = 1 - similarity for normalized vectors
-        # Actually cosine distance in pgvector is: 1 - cosine_similarity
-        # So distance < (1 - threshold) means similarity > threshold
-        max_distance = 1 - similarity_threshold
-        queryset = queryset.filter(distance__lte=max_distance)
+        # Filter by threshold: for unit vectors the annotated value is
+        # -similarity, so value <= -threshold means similarity >= threshold
+        queryset = queryset.filter(distance__lte=-similarity_threshold)
 
         # Limit results
         queryset = queryset[:limit]
 
+        # Materialize inside one transaction so SET LOCAL scopes the HNSW
+        # beam width to exactly this query.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL hnsw.ef_search = %s", [self.HNSW_EF_SEARCH]
+                )
+            campaigns = list(queryset)
+
         # Build result objects
         results = []
-        for campaign in queryset:
+        for campaign in campaigns:
             content_preview = (campaign.generated_content or "")[:self.CONTENT_PREVIEW_LENGTH]
             if len(campaign.generated_content or "") > self.CONTENT_PREVIEW_LENGTH:
                 content_preview += "..."
 
+            # Annotated value is -similarity; keep the reported distance in
+            # cosine terms (1 - similarity) so the API shape is unchanged
+            similarity = -campaign.distance
             results.append(SimilarCampaign(
                 campaign_id=str(campaign.id),
                 location_name=campaign.location.name,
                 template_name=campaign.template.name,
                 brand_name=campaign.location.brand.name,
                 content_preview=content_preview,
-                distance=campaign.distance,
-                similarity_score=1 - campaign.distance,
+                distance=1 - similarity,
+                similarity_score=similarity,
             ))
 
         return results
@@ -234,22 +316,33 @@ class SimilaritySearchService:
         """
         from apps.campaigns.models import LocationCampaign
 
-        try:
-            campaign = LocationCampaign.objects.select_related(
-                "location__brand"
-            ).get(id=campaign_id)
-        except LocationCampaign.DoesNotExist:
+        # Fetch only the columns this method needs; the default manager row
+        # would also drag the joined location/brand rows across the wire
+        # just to read one id.
+        row = LocationCampaign.objects.filter(id=campaign_id).values_list(
+            "content_embedding", "location__brand_id", "generated_content"
+        ).first()
+        if row is None:
             logger.error(f"Campaign {campaign_id} not found")
             return []
 
-        if campaign.content_embedding is None:
-            logger.warning(f"Campaign {campaign_id} has no embedding")
-            return []
+        embedding, campaign_brand_id, content = row
+        if embedding is None:
+            # No stored vector: embed the content once and persist it so
+            # the next lookup takes the precomputed path.
+            if not content:
+                logger.warning(f"Campaign {campaign_id} has no content to embed")
+                return []
+            embedding = self.generate_embedding(content)
+            LocationCampaign.objects.filter(id=campaign_id).update(
+                content_embedding=embedding,
+                content_hash=content_digest(content),
+            )
 
-        brand_id = str(campaign.location.brand_id) if same_brand_only else None
+        brand_id = str(campaign_brand_id) if same_brand_only else None
 
         return self.find_similar_campaigns(
-            query_embedding=list(campaign.content_embedding),
+            query_embedding=list(embedding),
             limit=limit,
             similarity_threshold=similarity_threshold,
             exclude_campaign_ids=[campaign_id],
@@ -347,13 +440,75 @@ class SimilaritySearchService:
         try:
             embedding = self.generate_embedding(campaign.generated_content)
             campaign.content_embedding = embedding
-            campaign.save(update_fields=["content_embedding", "updated_at"])
+            campaign.content_hash = content_digest(campaign.generated_content)
+            campaign.save(
+                update_fields=["content_embedding", "content_hash", "updated_at"]
+            )
             logger.info(f"Computed embedding for campaign {campaign.id}")
             return embedding
         except Exception as e:
             logger.exception(f"Failed to compute embedding for campaign {campaign.id}: {e}")
             return None
 
+    def _copy_update_embeddings(self, campaigns) -> None:
+        """
+        Write embeddings back through COPY and one joined UPDATE.
+
+        COPY streams the rows without per-row statement parsing or
+        parameter binding, and the single UPDATE ... FROM join applies
+        them in one pass; on multi-thousand-row recomputes this roughly
+        halves write time versus batched UPDATE statements.
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMPORARY TABLE tmp_campaign_embeddings ("
+                " id uuid PRIMARY KEY,"
+                " embedding vector(1536),"
+                " content_hash varchar(64)"
+                ") ON COMMIT DROP"
+            )
+            copy_sql = (
+                "COPY tmp_campaign_embeddings (id, embedding, content_hash)"
+                " FROM STDIN"
+            )
+            # cursor.cursor is the underlying psycopg cursor; Django's
+            # wrapper does not expose the COPY protocol itself.
+            with cursor.cursor.copy(copy_sql) as copy:
+                for campaign in campaigns:
+                    vector_literal = (
+                        "[" + ",".join(map(str, campaign.content_embedding)) + "]"
+                    )
+                    copy.write_row(
+                        (str(campaign.id), vector_literal, campaign.content_hash)
+                    )
+            cursor.execute(
+                "UPDATE location_campaigns c"
+                " SET content_embedding = t.embedding,"
+                "     content_hash = t.content_hash"
+                " FROM tmp_campaign_embeddings t"
+                " WHERE c.id = t.id"
+            )
+
+    @contextmanager
+    def _hnsw_index_dropped(self):
+        """
+        Drop the embedding index for the duration of a bulk write.
+
+        The rebuild runs in a finally block so a failed batch still leaves
+        the index in place, and uses CONCURRENTLY where the connection
+        allows it so similarity queries keep working during the build.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {self.HNSW_INDEX_NAME}")
+        try:
+            yield
+        finally:
+            concurrently = "" if connection.in_atomic_block else "CONCURRENTLY "
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    self.HNSW_INDEX_DDL.format(concurrently=concurrently)
+                )
+
     def bulk_compute_embeddings(
         self,
         campaign_ids: list[str] | None = None,
@@ -362,12 +517,18 @@ class SimilaritySearchService:
         """
         Compute embeddings for multiple campaigns.
 
+        Embeds EMBED_BATCH_SIZE campaigns per model call and writes each
+        batch back with one bulk_update, instead of one API round-trip and
+        one UPDATE per campaign. Campaigns whose stored content_hash still
+        matches their current content are skipped entirely, so re-seeding
+        unchanged data is a no-op.
+
         Args:
             campaign_ids: Specific campaign IDs to process (None = all)
-            recompute: If True, recompute even if embedding exists
+            recompute: If True, recompute even if content is unchanged
 
         Returns:
-            Dict with success/failure counts
+            Dict with success/failure/skip counts
         """
         from apps.campaigns.models import LocationCampaign
 
@@ -376,26 +537,105 @@ class SimilaritySearchService:
         ).exclude(generated_content="")
 
         if campaign_ids:
-            queryset = queryset.filter(id__in=campaign_ids)
+            # id = ANY(array) instead of id__in: the IN list expands to one
+            # placeholder per id, so parse cost grows with the batch and
+            # each distinct length is a new statement to the plan cache. A
+            # single array parameter keeps the statement constant-size.
+            queryset = queryset.extra(
+                where=["id = ANY(%s::uuid[])"],
+                params=[[str(cid) for cid in campaign_ids]],
+            )
 
-        if not recompute:
-            queryset = queryset.filter(content_embedding__isnull=True)
+        rows = queryset.only("id", "generated_content", "content_hash").annotate(
+            has_embedding=Q(content_embedding__isnull=False)
+        )
+
+        campaigns = []
+        skipped_count = 0
+        for campaign in rows:
+            digest = content_digest(campaign.generated_content)
+            if (
+                not recompute
+                and campaign.has_embedding
+                and campaign.content_hash == digest
+            ):
+                skipped_count += 1
+                continue
+            campaign.content_hash = digest
+            campaigns.append(campaign)
 
         success_count = 0
         failure_count = 0
 
-        for campaign in queryset:
-            try:
-                embedding = self.generate_embedding(campaign.generated_content)
-                campaign.content_embedding = embedding
-                campaign.save(update_fields=["content_embedding", "updated_at"])
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to embed campaign {campaign.id}: {e}")
-                failure_count += 1
+        # Large recomputes rewrite most of the index anyway; dropping it
+        # up front and rebuilding once afterwards beats per-row graph
+        # maintenance on every UPDATE.
+        if recompute and len(campaigns) > self.DEFERRED_INDEX_THRESHOLD:
+            index_guard = self._hnsw_index_dropped()
+        else:
+            index_guard = nullcontext()
+
+        # Large runs collect the embedded rows and flush them once through
+        # COPY; small runs keep the simpler per-batch bulk_update.
+        use_copy = len(campaigns) >= self.COPY_WRITE_THRESHOLD
+        copy_pending: list = []
+
+        with index_guard:
+            for start in range(0, len(campaigns), self.EMBED_BATCH_SIZE):
+                batch = campaigns[start:start + self.EMBED_BATCH_SIZE]
+                try:
+                    # The cache answers unchanged content; only misses reach
+                    # the embeddings API.
+                    with LLM_CALL_GATE:
+                        vectors = embed_cache.get_or_compute_many(
+                            [c.generated_content for c in batch],
+                            self.EMBEDDING_MODEL,
+                            self.embeddings.embed_documents,
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to embed batch of {len(batch)} campaigns: {e}"
+                    )
+                    failure_count += len(batch)
+                    continue
+
+                for campaign, vector in zip(batch, vectors, strict=True):
+                    campaign.content_embedding = normalize_vector(vector)
+
+                if use_copy:
+                    copy_pending.extend(batch)
+                else:
+                    # updated_at is maintained by the database trigger, so
+                    # the UPDATE only carries the columns that changed
+                    LocationCampaign.objects.bulk_update(
+                        batch,
+                        ["content_embedding", "content_hash"],
+                        batch_size=500,
+                    )
+                success_count += len(batch)
+
+            if copy_pending:
+                self._copy_update_embeddings(copy_pending)
 
         return {
             "success": success_count,
             "failed": failure_count,
+            "skipped": skipped_count,
             "total": success_count + failure_count,
         }
+
+
+# Process-wide service instance, shared for the same reason as the content
+# generator: the embeddings client and its HTTP pool are costly to build.
+_service: SimilaritySearchService | None = None
+_service_lock = threading.Lock()
+
+
+def get_similarity_search_service() -> SimilaritySearchService:
+    """Return the shared SimilaritySearchService instance."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = SimilaritySearchService()
+    return _service
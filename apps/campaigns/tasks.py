@@ -28,7 +28,8 @@ def generate_campaign_content(self, campaign_id: str) -> dict:
         dict with status and generated content
     """
     from apps.campaigns.models import LocationCampaign
-    from apps.campaigns.services.content_generator import ContentGeneratorService
+    from apps.campaigns.services.content_generator import get_content_generator_service
+    from apps.campaigns.services.similarity_search import content_digest
 
     try:
         campaign = LocationCampaign.objects.select_related(
@@ -37,14 +38,19 @@ def generate_campaign_content(self, campaign_id: str) -> dict:
 
         logger.info(f"Generating content for campaign {campaign_id}")
 
-        service = ContentGeneratorService()
+        service = get_content_generator_service()
         result, embedding = service.generate_and_embed(campaign)
 
         # Update campaign with generated content and embedding
         campaign.generated_content = result.content
+        update_fields = ["generated_content", "updated_at"]
         if embedding:
+            # content_hash must track the embedding's source content, or
+            # bulk_compute_embeddings re-selects this campaign.
             campaign.content_embedding = embedding
-        campaign.save(update_fields=["generated_content", "content_embedding", "updated_at"])
+            campaign.content_hash = content_digest(result.content)
+            update_fields += ["content_embedding", "content_hash"]
+        campaign.save(update_fields=update_fields)
 
         logger.info(f"Content generated successfully for campaign {campaign_id}")
 
@@ -64,11 +70,48 @@ def generate_campaign_content(self, campaign_id: str) -> dict:
         raise self.retry(exc=exc)
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def generate_template_preview(self, content_template: str, sample_context: dict) -> dict:
+    """
+    Generate an AI template preview off the request/response cycle.
+
+    Lets the preview endpoint return immediately instead of holding an
+    HTTP worker for the OpenAI round trip; the result is read back via
+    the preview_status endpoint.
+
+    Args:
+        content_template: Jinja2 template string to preview
+        sample_context: Sample data for the preview prompt
+
+    Returns:
+        dict with status and the generated preview
+    """
+    from apps.campaigns.services.content_generator import get_content_generator_service
+
+    try:
+        service = get_content_generator_service()
+        preview = service.generate_preview(content_template, sample_context)
+
+        return {
+            "status": "success",
+            "preview": preview,
+            "used_ai": True,
+        }
+
+    except Exception as exc:
+        logger.exception("Error generating template preview")
+        raise self.retry(exc=exc) from exc
+
+
 @shared_task
 def activate_scheduled_campaigns() -> dict:
     """
     Check for approved campaigns that are scheduled to start and activate them.
-    Runs every 5 minutes via Celery Beat.
+
+    Queued as a one-shot with apply_async(eta=scheduled_start) when a
+    campaign is scheduled, so work happens at the transition moment
+    instead of a constant poll; an hourly Beat sweep backs it up in case
+    an eta message is lost. Idempotent — a run with nothing due is a no-op.
 
     Returns:
         dict with count of activated campaigns
@@ -91,6 +134,10 @@ def activate_scheduled_campaigns() -> dict:
                 campaign.save()
                 activated_count += 1
                 logger.info(f"Activated campaign {campaign.id}")
+            # Chain the completion sweep for this campaign's end time so
+            # completion is also event-driven rather than polled.
+            if campaign.scheduled_end:
+                complete_expired_campaigns.apply_async(eta=campaign.scheduled_end)
         except Exception as e:
             logger.error(f"Failed to activate campaign {campaign.id}: {e}")
 
@@ -104,7 +151,10 @@ def activate_scheduled_campaigns() -> dict:
 def complete_expired_campaigns() -> dict:
     """
     Check for active campaigns that have passed their end date and complete them.
-    Runs every 5 minutes via Celery Beat.
+
+    Queued as a one-shot with apply_async(eta=scheduled_end) when a
+    campaign is activated, with an hourly Beat sweep as backup.
+    Idempotent — a run with nothing due is a no-op.
 
     Returns:
         dict with count of completed campaigns
@@ -284,6 +334,44 @@ def send_campaign_notification(
         raise self.retry(exc=exc)
 
 
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def bulk_compute_campaign_embeddings(
+    self,
+    campaign_ids: list[str] | None = None,
+    recompute: bool = False,
+) -> dict:
+    """
+    Run bulk embedding computation off the request/response cycle.
+
+    Embedding thousands of campaigns can take minutes of model calls;
+    queuing it keeps HTTP workers free and lets throughput scale with
+    the worker pool instead. The result is read back via the
+    embeddings_status endpoint.
+
+    Args:
+        campaign_ids: Specific campaign UUIDs to process (None = all)
+        recompute: If True, recompute even if content is unchanged
+
+    Returns:
+        dict with success/failure/skip counts
+    """
+    from apps.campaigns.services.similarity_search import (
+        get_similarity_search_service,
+    )
+
+    try:
+        service = get_similarity_search_service()
+        result = service.bulk_compute_embeddings(
+            campaign_ids=campaign_ids,
+            recompute=recompute,
+        )
+        return {"status": "success", **result}
+
+    except Exception as exc:
+        logger.exception("Error in bulk embedding computation")
+        raise self.retry(exc=exc) from exc
+
+
 @shared_task
 def bulk_generate_campaign_content(campaign_ids: list[str]) -> dict:
     """
@@ -323,7 +411,7 @@ def generate_html_email_content(self, campaign_id: str) -> dict:
         dict with status and generated content info
     """
     from apps.campaigns.models import LocationCampaign
-    from apps.campaigns.services.content_generator import ContentGeneratorService
+    from apps.campaigns.services.content_generator import get_content_generator_service
 
     try:
         campaign = LocationCampaign.objects.select_related(
@@ -336,7 +424,7 @@ def generate_html_email_content(self, campaign_id: str) -> dict:
 
         logger.info(f"Generating HTML email for campaign {campaign_id}")
 
-        service = ContentGeneratorService()
+        service = get_content_generator_service()
         result = service.generate_full_email(campaign)
 
         # Save to campaign
@@ -174,36 +174,53 @@ class TestCampaignFSMTransitions:
         rejected_campaign.save()
         assert rejected_campaign.status == LocationCampaign.Status.DRAFT
 
-    # Invalid transition tests
-    def test_cannot_approve_draft(self, draft_campaign):
+
+class TestCampaignFSMGuards:
+    """
+    Invalid-transition tests on unsaved instances.
+
+    The guards are pure in-memory logic, so these tests build the
+    campaign with unsaved_campaign_factory and never touch the
+    database — no django_db marker needed.
+    """
+
+    def test_cannot_approve_draft(self, unsaved_campaign_factory):
         """Test that DRAFT cannot transition directly to APPROVED."""
+        campaign = unsaved_campaign_factory(status=LocationCampaign.Status.DRAFT)
         with pytest.raises(TransitionNotAllowed):
-            draft_campaign.approve()
+            campaign.approve()
 
-    def test_cannot_submit_pending(self, pending_campaign):
+    def test_cannot_submit_pending(self, unsaved_campaign_factory):
         """Test that PENDING_REVIEW cannot be submitted again."""
+        campaign = unsaved_campaign_factory(
+            status=LocationCampaign.Status.PENDING_REVIEW
+        )
         with pytest.raises(TransitionNotAllowed):
-            pending_campaign.submit_for_review()
+            campaign.submit_for_review()
 
-    def test_cannot_schedule_draft(self, draft_campaign):
+    def test_cannot_schedule_draft(self, unsaved_campaign_factory):
         """Test that DRAFT cannot transition directly to SCHEDULED."""
+        campaign = unsaved_campaign_factory(status=LocationCampaign.Status.DRAFT)
         with pytest.raises(TransitionNotAllowed):
-            draft_campaign.schedule()
+            campaign.schedule()
 
-    def test_cannot_activate_approved(self, approved_campaign):
+    def test_cannot_activate_approved(self, unsaved_campaign_factory):
         """Test that APPROVED cannot transition directly to ACTIVE."""
+        campaign = unsaved_campaign_factory(status=LocationCampaign.Status.APPROVED)
         with pytest.raises(TransitionNotAllowed):
-            approved_campaign.activate()
+            campaign.activate()
 
-    def test_cannot_complete_approved(self, approved_campaign):
+    def test_cannot_complete_approved(self, unsaved_campaign_factory):
         """Test that APPROVED cannot transition directly to COMPLETED."""
+        campaign = unsaved_campaign_factory(status=LocationCampaign.Status.APPROVED)
         with pytest.raises(TransitionNotAllowed):
-            approved_campaign.complete()
+            campaign.complete()
 
-    def test_cannot_revise_approved(self, approved_campaign):
+    def test_cannot_revise_approved(self, unsaved_campaign_factory):
         """Test that APPROVED cannot be revised."""
+        campaign = unsaved_campaign_factory(status=LocationCampaign.Status.APPROVED)
         with pytest.raises(TransitionNotAllowed):
-            approved_campaign.revise()
+            campaign.revise()
 
 
 @pytest.mark.django_db
@@ -266,7 +283,6 @@ class TestApprovalStepModel:
         assert steps[1] == step1
 
 
-@pytest.mark.django_db
 class TestCampaignStatusChoices:
     """Tests for campaign status choices."""
 
@@ -88,7 +88,7 @@ class TestCampaignTemplateViewSet:
             f"{self.base_url}{campaign_template.id}/", data, format="json"
         )
         assert response.status_code == status.HTTP_200_OK
-        campaign_template.refresh_from_db()
+        campaign_template.refresh_from_db(fields=["name"])
         assert campaign_template.name == "Updated Template Name"
 
     def test_delete_template(self, admin_client, campaign_template):
@@ -130,6 +130,17 @@ class TestLocationCampaignViewSet:
         assert response.data["status"] == "draft"
         assert "approval_history" in response.data
 
+    def test_retrieve_campaign_not_modified(self, admin_client, draft_campaign):
+        """Test conditional retrieve returns 304 when the ETag matches."""
+        response = admin_client.get(f"{self.base_url}{draft_campaign.id}/")
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+
+        response = admin_client.get(
+            f"{self.base_url}{draft_campaign.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
     def test_create_campaign(self, admin_client, location, campaign_template):
         """Test creating a location campaign."""
         initial_count = LocationCampaign.objects.count()
@@ -157,7 +168,7 @@ class TestLocationCampaignViewSet:
             f"{self.base_url}{draft_campaign.id}/", data, format="json"
         )
         assert response.status_code == status.HTTP_200_OK
-        draft_campaign.refresh_from_db()
+        draft_campaign.refresh_from_db(fields=["customizations"])
         assert draft_campaign.customizations["discount_percentage"] == 50
 
     def test_delete_campaign(self, admin_client, draft_campaign):
@@ -183,7 +194,7 @@ class TestCampaignWorkflowActions:
         )
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "submitted"
-        draft_campaign.refresh_from_db()
+        draft_campaign.refresh_from_db(fields=["status"])
         assert draft_campaign.status == LocationCampaign.Status.PENDING_REVIEW
         # Check approval step was created
         assert draft_campaign.approval_steps.filter(
@@ -207,7 +218,7 @@ class TestCampaignWorkflowActions:
         )
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "approved"
-        pending_campaign.refresh_from_db()
+        pending_campaign.refresh_from_db(fields=["status"])
         assert pending_campaign.status == LocationCampaign.Status.APPROVED
 
     def test_approve_campaign_viewer_forbidden(self, viewer_client, pending_campaign):
@@ -235,7 +246,7 @@ class TestCampaignWorkflowActions:
         )
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "rejected"
-        pending_campaign.refresh_from_db()
+        pending_campaign.refresh_from_db(fields=["status"])
         assert pending_campaign.status == LocationCampaign.Status.REJECTED
 
     def test_reject_campaign_requires_comments(self, admin_client, pending_campaign):
@@ -280,7 +291,7 @@ class TestCampaignWorkflowActions:
         )
         assert response.status_code == status.HTTP_200_OK
         assert response.data["status"] == "draft"
-        rejected_campaign.refresh_from_db()
+        rejected_campaign.refresh_from_db(fields=["status"])
         assert rejected_campaign.status == LocationCampaign.Status.DRAFT
 
     def test_revise_approved_campaign_fails(self, admin_client, approved_campaign):
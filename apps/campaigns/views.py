@@ -1,12 +1,20 @@
+import uuid
+from types import MappingProxyType
+
+from django.core.exceptions import ValidationError
 from django.db import transaction
-from django_fsm import can_proceed
+from django.db.models import Count, F, Max, Prefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from apps.core.pagination import StandardPagination
-from apps.core.permissions import HasBrandAccess, IsBrandManager
+from apps.core.pagination import StandardPagination, WindowCountPagination
+from apps.core.permissions import (
+    HasBrandAccess,
+    IsBrandManager,
+    get_accessible_brand_ids,
+)
 
 from .models import ApprovalStep, CampaignTemplate, LocationCampaign
 from .serializers import (
@@ -15,6 +23,8 @@ from .serializers import (
     CampaignTemplateCreateUpdateSerializer,
     CampaignTemplateDetailSerializer,
     CampaignTemplateListSerializer,
+    CampaignTemplateListValuesSerializer,
+    ContentGenerationSerializer,
     EmailPreviewSerializer,
     EmailRecipientCreateSerializer,
     EmailRecipientSerializer,
@@ -22,9 +32,87 @@ from .serializers import (
     LocationCampaignCreateUpdateSerializer,
     LocationCampaignDetailSerializer,
     LocationCampaignListSerializer,
+    LocationCampaignListValuesSerializer,
     SendEmailsSerializer,
+    SimilarCampaignQuerySerializer,
+    SimilarSearchRequestSerializer,
 )
 
+# Source statuses for each workflow transition, derived once at import time
+# from the FSM declarations. Checking `status in _TRANSITION_SOURCES[name]`
+# avoids django-fsm's per-call transition introspection in the hot action
+# endpoints.
+_TRANSITION_SOURCES = {
+    name: frozenset(
+        t.source
+        for t in LocationCampaign._meta.get_field("status").get_all_transitions(LocationCampaign)
+        if t.name == name
+    )
+    for name in ("submit_for_review", "approve", "reject", "schedule", "revise")
+}
+
+# Default sample data for the template preview endpoint; built once and
+# kept read-only instead of being rebuilt on every request.
+_PREVIEW_SAMPLE_CONTEXT = MappingProxyType({
+    "brand_name": "Acme Retail",
+    "location_name": "Downtown Store",
+    "store_number": "001",
+    "full_address": "123 Main St, Austin, TX 78701",
+    "city": "Austin",
+    "state": "TX",
+    "street": "123 Main St",
+    "zip": "78701",
+})
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag support for detail endpoints.
+
+    Computes a weak validator via a cheap values_list query, so polling
+    clients get a 304 without paying for the full
+    select_related/prefetch_related load and serialization. The query
+    goes through get_queryset() so the short-circuit sees exactly the
+    rows the viewset's access scoping allows.
+    """
+
+    def _etag_values(self):
+        """
+        Row values the validator is derived from.
+
+        The base implementation covers models whose serialized state
+        lives entirely on the row; viewsets whose detail payload renders
+        rows from other tables override this to fold that state in.
+        """
+        return (
+            self.get_queryset()
+            .filter(pk=self.kwargs["pk"])
+            .values_list("updated_at")
+            .first()
+        )
+
+    def _detail_etag(self):
+        try:
+            values = self._etag_values()
+        except (ValueError, ValidationError):
+            return None
+        if values is None or values[0] is None:
+            return None
+        parts = [
+            str(value.timestamp()) if hasattr(value, "timestamp") else str(value)
+            for value in values
+        ]
+        return '"{}"'.format(":".join(parts))
+
+    def retrieve(self, request, *args, **kwargs):
+        etag = self._detail_etag()
+        if etag and request.headers.get("If-None-Match") == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        response = super().retrieve(request, *args, **kwargs)
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -58,7 +146,7 @@ from .serializers import (
         tags=["campaign-templates"],
     ),
 )
-class CampaignTemplateViewSet(viewsets.ModelViewSet):
+class CampaignTemplateViewSet(ConditionalRetrieveMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing campaign templates.
 
@@ -69,33 +157,59 @@ class CampaignTemplateViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, HasBrandAccess]
     pagination_class = StandardPagination
 
+    # Query param -> ORM lookup for plain equality filters. brand,
+    # is_active and search need validation/coercion and stay special-cased.
+    FILTERS = {
+        "campaign_type": "campaign_type",
+    }
+
     def get_queryset(self):
         user = self.request.user
+        params = self.request.query_params
         queryset = CampaignTemplate.objects.select_related("brand")
 
+        # The list serializer never renders the template body; skip the
+        # large text columns there.
+        if self.action == "list":
+            queryset = queryset.defer("description", "content_template")
+
         # Filter by user's brand access
         if user.role != "admin":
-            queryset = queryset.filter(brand__in=user.brands.all())
+            queryset = queryset.filter(
+                brand_id__in=get_accessible_brand_ids(self.request)
+            )
 
-        # Filter by brand if provided
-        brand_id = self.request.query_params.get("brand")
-        if brand_id:
-            queryset = queryset.filter(brand_id=brand_id)
+        # Validate query params up front and collect them into a single
+        # filter() call; an invalid value can never match anything, so
+        # short-circuit with none() instead of letting the DB raise late.
+        filters = {
+            lookup: params[param]
+            for param, lookup in self.FILTERS.items()
+            if params.get(param)
+        }
 
-        # Filter by campaign type if provided
-        campaign_type = self.request.query_params.get("campaign_type")
-        if campaign_type:
-            queryset = queryset.filter(campaign_type=campaign_type)
+        brand_id = params.get("brand")
+        if brand_id:
+            try:
+                filters["brand_id"] = uuid.UUID(brand_id)
+            except ValueError:
+                return queryset.none()
 
-        # Filter by active status if provided
-        is_active = self.request.query_params.get("is_active")
+        is_active = params.get("is_active")
         if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
+            filters["is_active"] = is_active.lower() == "true"
 
-        # Search by name
-        search = self.request.query_params.get("search")
+        search = params.get("search")
         if search:
-            queryset = queryset.filter(name__icontains=search)
+            # Substring match, not fuzzy: the API contract is "name contains
+            # the term". The tmpl_name_trgm GIN (gin_trgm_ops) index turns
+            # this ILIKE '%term%' into an indexed bitmap scan, so a
+            # TrigramSimilarity rewrite would change semantics for no
+            # additional index benefit.
+            filters["name__icontains"] = search
+
+        if filters:
+            queryset = queryset.filter(**filters)
 
         return queryset
 
@@ -111,6 +225,33 @@ class CampaignTemplateViewSet(viewsets.ModelViewSet):
             return [permissions.IsAuthenticated(), IsBrandManager()]
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        """List templates from a values() queryset, skipping model instantiation."""
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .values(
+                "id",
+                "brand",
+                "name",
+                "campaign_type",
+                "is_active",
+                "created_at",
+                brand_name=F("brand__name"),
+            )
+            .annotate(campaign_count=Count("location_campaigns"))
+            # values().annotate() grouping drops the model Meta ordering;
+            # restore it explicitly for stable pagination
+            .order_by("brand", "name")
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = CampaignTemplateListValuesSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = CampaignTemplateListValuesSerializer(queryset, many=True)
+        return Response(serializer.data)
+
     @extend_schema(
         summary="Preview template content",
         description="""
@@ -121,11 +262,15 @@ a sample output based on the template.
 - `content_template`: The Jinja2 template content to preview
 - `use_ai`: Whether to generate AI content (default: false)
 - `sample_data`: Optional custom sample data for variables
+- `async_generation`: Queue AI preview as background task (default: false)
 
 **Response:**
 - `preview`: The rendered/generated preview content
 - `variables`: List of variables found in the template
 - `used_ai`: Whether AI was used for generation
+
+With `async_generation`, returns a `task_id` instead; poll
+`preview_status/<task_id>/` for the result.
         """,
         request={
             "application/json": {
@@ -134,6 +279,7 @@ a sample output based on the template.
                     "content_template": {"type": "string"},
                     "use_ai": {"type": "boolean", "default": False},
                     "sample_data": {"type": "object"},
+                    "async_generation": {"type": "boolean", "default": False},
                 },
                 "required": ["content_template"],
             }
@@ -153,11 +299,13 @@ a sample output based on the template.
     @action(detail=False, methods=["post"])
     def preview(self, request):
         """Preview template content with sample data or AI generation."""
-        from .services.content_generator import ContentGeneratorService
+        from .services.content_generator import get_content_generator_service
+        from .tasks import generate_template_preview
 
         content_template = request.data.get("content_template", "")
         use_ai = request.data.get("use_ai", False)
         sample_data = request.data.get("sample_data", {})
+        async_generation = request.data.get("async_generation", False)
 
         if not content_template:
             return Response(
@@ -165,7 +313,7 @@ a sample output based on the template.
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        generator = ContentGeneratorService()
+        generator = get_content_generator_service()
 
         # Validate and extract variables
         validation = generator.validate_template(content_template)
@@ -175,47 +323,22 @@ a sample output based on the template.
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Default sample context
-        default_context = {
-            "brand_name": "Acme Retail",
-            "location_name": "Downtown Store",
-            "store_number": "001",
-            "full_address": "123 Main St, Austin, TX 78701",
-            "city": "Austin",
-            "state": "TX",
-            "street": "123 Main St",
-            "zip": "78701",
-        }
+        # Merge custom sample data over the shared defaults
+        context = {**_PREVIEW_SAMPLE_CONTEXT, **sample_data}
 
-        # Merge with custom sample data
-        context = {**default_context, **sample_data}
+        # AI previews take seconds; queue them off the HTTP worker when
+        # the client opts in, mirroring generate_content's async path.
+        if async_generation and use_ai and generator.openai_api_key:
+            task = generate_template_preview.delay(content_template, context)
+            return Response({
+                "status": "queued",
+                "task_id": task.id,
+                "variables": validation["variables"],
+            })
 
         try:
             if use_ai and generator.openai_api_key:
-                # Generate AI preview
-                from langchain_core.messages import HumanMessage, SystemMessage
-
-                preview_prompt = f"""Generate a sample marketing content based on this template:
-
-Template:
-{content_template}
-
-Sample Context:
-- Brand: {context.get('brand_name')}
-- Location: {context.get('location_name')}
-- Store Number: {context.get('store_number')}
-- Address: {context.get('full_address')}
-
-Generate polished, ready-to-use marketing content following the template structure.
-Only output the final content, no explanations."""
-
-                messages = [
-                    SystemMessage(content=generator.SYSTEM_PROMPT),
-                    HumanMessage(content=preview_prompt),
-                ]
-
-                response = generator.llm.invoke(messages)
-                preview = response.content.strip()
+                preview = generator.generate_preview(content_template, context)
                 used_ai = True
             else:
                 # Template-only preview
@@ -234,6 +357,39 @@ Only output the final content, no explanations."""
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @extend_schema(
+        summary="Poll preview task result",
+        description="Returns the result of a queued AI preview generation.",
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "status": {"type": "string"},
+                    "preview": {"type": "string"},
+                    "used_ai": {"type": "boolean"},
+                },
+            }
+        },
+        tags=["campaign-templates"],
+    )
+    @action(detail=False, methods=["get"], url_path="preview_status/(?P<task_id>[^/.]+)")
+    def preview_status(self, request, task_id=None):
+        """Poll the result of a queued preview generation."""
+        from celery.result import AsyncResult
+
+        result = AsyncResult(task_id)
+
+        if not result.ready():
+            return Response({"status": "pending", "task_id": task_id})
+
+        if result.successful():
+            return Response(result.result)
+
+        return Response(
+            {"status": "error", "message": str(result.result)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -267,7 +423,7 @@ Only output the final content, no explanations."""
         tags=["location-campaigns"],
     ),
 )
-class LocationCampaignViewSet(viewsets.ModelViewSet):
+class LocationCampaignViewSet(ConditionalRetrieveMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing location campaigns and their approval workflow.
 
@@ -276,40 +432,102 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [permissions.IsAuthenticated, HasBrandAccess]
-    pagination_class = StandardPagination
+    pagination_class = WindowCountPagination
+
+    # Query param -> ORM lookup, applied in one filter() call.
+    FILTERS = {
+        "status": "status",
+        "location": "location_id",
+        "template": "template_id",
+        "brand": "location__brand_id",
+    }
+
+    # Workflow actions only inspect status and the schedule window before
+    # writing, so they fetch a narrow row instead of the full detail load.
+    TRANSITION_ACTIONS = frozenset(
+        {"submit", "approve", "reject", "schedule", "revise"}
+    )
+
+    def _relation_queryset(self):
+        """Base queryset with the relations the serializers render."""
+        return LocationCampaign.objects.select_related(
+            "location", "location__brand", "template", "created_by"
+        ).prefetch_related(
+            # The detail serializer renders each step's approver name, so
+            # join the approver into the prefetch query instead of loading
+            # users one by one.
+            Prefetch(
+                "approval_steps",
+                queryset=ApprovalStep.objects.select_related("approver").only(
+                    "id",
+                    "campaign_id",
+                    "approver",
+                    "decision",
+                    "comments",
+                    "previous_status",
+                    "new_status",
+                    "created_at",
+                ),
+            )
+        )
 
     def get_queryset(self):
         user = self.request.user
-        queryset = LocationCampaign.objects.select_related(
-            "location", "location__brand", "template", "created_by"
-        ).prefetch_related("approval_steps")
+
+        if self.action in self.TRANSITION_ACTIONS:
+            # Transition guards never read the content columns or approval
+            # history; the response serializer re-fetches a warmed instance
+            # after the transition commits.
+            queryset = LocationCampaign.objects.only(
+                "id", "status", "scheduled_start", "scheduled_end"
+            )
+        elif self.action == "list":
+            # The 1536-float embedding and the content bodies are never shown
+            # in list responses; deferring them keeps page queries narrow.
+            queryset = self._relation_queryset().defer(
+                "content_embedding", "generated_content", "generated_html_email"
+            )
+        else:
+            # The detail serializer exposes the recipient count; folding it
+            # into the main SELECT saves a COUNT query per object.
+            queryset = self._relation_queryset().annotate(
+                email_recipient_total=Count("email_recipients")
+            )
 
         # Filter by user's brand access
         if user.role != "admin":
-            queryset = queryset.filter(location__brand__in=user.brands.all())
-
-        # Filter by status if provided
-        status_filter = self.request.query_params.get("status")
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
-
-        # Filter by location if provided
-        location_id = self.request.query_params.get("location")
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-
-        # Filter by template if provided
-        template_id = self.request.query_params.get("template")
-        if template_id:
-            queryset = queryset.filter(template_id=template_id)
+            queryset = queryset.filter(
+                location__brand_id__in=get_accessible_brand_ids(self.request)
+            )
 
-        # Filter by brand if provided
-        brand_id = self.request.query_params.get("brand")
-        if brand_id:
-            queryset = queryset.filter(location__brand_id=brand_id)
+        # Apply the table-driven query param filters
+        params = self.request.query_params
+        filters = {
+            lookup: params[param]
+            for param, lookup in self.FILTERS.items()
+            if params.get(param)
+        }
+        if filters:
+            queryset = queryset.filter(**filters)
 
         return queryset
 
+    def _etag_values(self):
+        # The detail payload renders email_recipient_count, and recipient
+        # writes never touch the campaign row, so the validator has to
+        # carry recipient state too: the count catches deletions, the
+        # latest timestamp catches additions.
+        return (
+            self.get_queryset()
+            .filter(pk=self.kwargs["pk"])
+            .annotate(
+                _recipient_total=Count("email_recipients"),
+                _recipient_latest=Max("email_recipients__updated_at"),
+            )
+            .values_list("updated_at", "_recipient_total", "_recipient_latest")
+            .first()
+        )
+
     def get_serializer_class(self):
         if self.action == "list":
             return LocationCampaignListSerializer
@@ -317,12 +535,46 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
             return LocationCampaignCreateUpdateSerializer
         return LocationCampaignDetailSerializer
 
+    def list(self, request, *args, **kwargs):
+        """List campaigns from a values() queryset, skipping model instantiation."""
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .prefetch_related(None)
+            .values(
+                "id",
+                "location",
+                "template",
+                "status",
+                "scheduled_start",
+                "scheduled_end",
+                "created_at",
+                location_name=F("location__name"),
+                template_name=F("template__name"),
+                brand_name=F("location__brand__name"),
+            )
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = LocationCampaignListValuesSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = LocationCampaignListValuesSerializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def get_permissions(self):
+        # Role-gate approve/reject before any DB work; forbidden requests
+        # never load the campaign.
+        if self.action in ["approve", "reject"]:
+            return [permissions.IsAuthenticated(), IsBrandManager(), HasBrandAccess()]
+        return super().get_permissions()
+
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
     def _create_approval_step(self, campaign, user, decision, comments, prev_status, new_status):
         """Helper to create an approval step record."""
-        ApprovalStep.objects.create(
+        return ApprovalStep.objects.create(
             campaign=campaign,
             approver=user,
             decision=decision,
@@ -331,6 +583,42 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
             new_status=new_status,
         )
 
+    def _perform_transition(self, request, campaign, transition, decision, comments):
+        """
+        Apply an FSM transition and record its audit row in one atomic block.
+
+        Writes only the status and timestamp columns instead of the full row,
+        so each workflow action costs one narrow UPDATE plus one INSERT.
+        """
+        with transaction.atomic(savepoint=False):
+            prev_status = campaign.status
+            transition()
+            campaign.save(update_fields=["status", "updated_at"])
+
+            self._create_approval_step(
+                campaign=campaign,
+                user=request.user,
+                decision=decision,
+                comments=comments,
+                prev_status=prev_status,
+                new_status=campaign.status,
+            )
+
+    def _transition_response(self, request, campaign, status_label):
+        """Serialize the campaign exactly once for a workflow action response."""
+        # The transition worked on a narrow row; one warm fetch loads the
+        # relations and recipient count the detail serializer renders,
+        # including the approval step just written.
+        campaign = (
+            self._relation_queryset()
+            .annotate(email_recipient_total=Count("email_recipients"))
+            .get(pk=campaign.pk)
+        )
+        data = LocationCampaignDetailSerializer(
+            campaign, context={"request": request}
+        ).data
+        return Response({"status": status_label, "campaign": data})
+
     @extend_schema(
         summary="Submit for review",
         description="Submits a draft campaign for approval review.",
@@ -343,7 +631,7 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         """Submit campaign for review."""
         campaign = self.get_object()
 
-        if not can_proceed(campaign.submit_for_review):
+        if campaign.status not in _TRANSITION_SOURCES["submit_for_review"]:
             return Response(
                 {"error": f"Cannot submit campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -352,24 +640,16 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         serializer = CampaignActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        with transaction.atomic():
-            prev_status = campaign.status
-            campaign.submit_for_review()
-            campaign.save()
-
-            self._create_approval_step(
-                campaign=campaign,
-                user=request.user,
-                decision=ApprovalStep.Decision.SUBMITTED,
-                comments=serializer.validated_data.get("comments", ""),
-                prev_status=prev_status,
-                new_status=campaign.status,
-            )
-
-        return Response(
-            {"status": "submitted", "campaign": LocationCampaignDetailSerializer(campaign).data}
+        self._perform_transition(
+            request,
+            campaign,
+            campaign.submit_for_review,
+            ApprovalStep.Decision.SUBMITTED,
+            serializer.validated_data.get("comments", ""),
         )
 
+        return self._transition_response(request, campaign, "submitted")
+
     @extend_schema(
         summary="Approve campaign",
         description="Approves a pending campaign. Requires brand_manager or admin role.",
@@ -382,14 +662,7 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         """Approve campaign."""
         campaign = self.get_object()
 
-        # Check permission - only brand_manager and admin can approve
-        if request.user.role not in ["admin", "brand_manager"]:
-            return Response(
-                {"error": "You do not have permission to approve campaigns."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        if not can_proceed(campaign.approve):
+        if campaign.status not in _TRANSITION_SOURCES["approve"]:
             return Response(
                 {"error": f"Cannot approve campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -398,24 +671,16 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         serializer = CampaignActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        with transaction.atomic():
-            prev_status = campaign.status
-            campaign.approve()
-            campaign.save()
-
-            self._create_approval_step(
-                campaign=campaign,
-                user=request.user,
-                decision=ApprovalStep.Decision.APPROVED,
-                comments=serializer.validated_data.get("comments", ""),
-                prev_status=prev_status,
-                new_status=campaign.status,
-            )
-
-        return Response(
-            {"status": "approved", "campaign": LocationCampaignDetailSerializer(campaign).data}
+        self._perform_transition(
+            request,
+            campaign,
+            campaign.approve,
+            ApprovalStep.Decision.APPROVED,
+            serializer.validated_data.get("comments", ""),
         )
 
+        return self._transition_response(request, campaign, "approved")
+
     @extend_schema(
         summary="Reject campaign",
         description="Rejects a pending campaign with required comments. Requires brand_manager or admin role.",
@@ -428,14 +693,7 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         """Reject campaign."""
         campaign = self.get_object()
 
-        # Check permission - only brand_manager and admin can reject
-        if request.user.role not in ["admin", "brand_manager"]:
-            return Response(
-                {"error": "You do not have permission to reject campaigns."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        if not can_proceed(campaign.reject):
+        if campaign.status not in _TRANSITION_SOURCES["reject"]:
             return Response(
                 {"error": f"Cannot reject campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -444,24 +702,16 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         serializer = CampaignRejectSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        with transaction.atomic():
-            prev_status = campaign.status
-            campaign.reject()
-            campaign.save()
-
-            self._create_approval_step(
-                campaign=campaign,
-                user=request.user,
-                decision=ApprovalStep.Decision.REJECTED,
-                comments=serializer.validated_data["comments"],
-                prev_status=prev_status,
-                new_status=campaign.status,
-            )
-
-        return Response(
-            {"status": "rejected", "campaign": LocationCampaignDetailSerializer(campaign).data}
+        self._perform_transition(
+            request,
+            campaign,
+            campaign.reject,
+            ApprovalStep.Decision.REJECTED,
+            serializer.validated_data["comments"],
         )
 
+        return self._transition_response(request, campaign, "rejected")
+
     @extend_schema(
         summary="Schedule campaign",
         description="Schedules an approved campaign for activation. Requires scheduled dates to be set.",
@@ -474,7 +724,7 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         """Schedule an approved campaign."""
         campaign = self.get_object()
 
-        if not can_proceed(campaign.schedule):
+        if campaign.status not in _TRANSITION_SOURCES["schedule"]:
             return Response(
                 {"error": f"Cannot schedule campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -487,23 +737,22 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        with transaction.atomic():
-            prev_status = campaign.status
-            campaign.schedule()
-            campaign.save()
+        self._perform_transition(
+            request,
+            campaign,
+            campaign.schedule,
+            ApprovalStep.Decision.APPROVED,
+            "Campaign scheduled",
+        )
 
-            self._create_approval_step(
-                campaign=campaign,
-                user=request.user,
-                decision=ApprovalStep.Decision.APPROVED,
-                comments="Campaign scheduled",
-                prev_status=prev_status,
-                new_status=campaign.status,
-            )
+        # Queue a one-shot activation sweep for the exact start time
+        # instead of relying on the periodic poll; the hourly Beat sweep
+        # stays as a backup if the broker loses the eta.
+        from .tasks import activate_scheduled_campaigns
 
-        return Response(
-            {"status": "scheduled", "campaign": LocationCampaignDetailSerializer(campaign).data}
-        )
+        activate_scheduled_campaigns.apply_async(eta=campaign.scheduled_start)
+
+        return self._transition_response(request, campaign, "scheduled")
 
     @extend_schema(
         summary="Revise campaign",
@@ -517,7 +766,7 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         """Return campaign to draft for revision."""
         campaign = self.get_object()
 
-        if not can_proceed(campaign.revise):
+        if campaign.status not in _TRANSITION_SOURCES["revise"]:
             return Response(
                 {"error": f"Cannot revise campaign with status '{campaign.status}'."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -526,24 +775,16 @@ class LocationCampaignViewSet(viewsets.ModelViewSet):
         serializer = CampaignActionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        with transaction.atomic():
-            prev_status = campaign.status
-            campaign.revise()
-            campaign.save()
-
-            self._create_approval_step(
-                campaign=campaign,
-                user=request.user,
-                decision=ApprovalStep.Decision.REQUESTED_CHANGES,
-                comments=serializer.validated_data.get("comments", "Returned for revision"),
-                prev_status=prev_status,
-                new_status=campaign.status,
-            )
-
-        return Response(
-            {"status": "draft", "campaign": LocationCampaignDetailSerializer(campaign).data}
+        self._perform_transition(
+            request,
+            campaign,
+            campaign.revise,
+            ApprovalStep.Decision.REQUESTED_CHANGES,
+            serializer.validated_data.get("comments", "Returned for revision"),
         )
 
+        return self._transition_response(request, campaign, "draft")
+
     # ========== AI Content Generation Endpoints ==========
 
     @extend_schema(
@@ -585,14 +826,17 @@ An embedding is computed and stored for similarity search.
     @action(detail=True, methods=["post"])
     def generate_content(self, request, pk=None):
         """Generate content for a campaign."""
-        from .services.content_generator import ContentGeneratorService
+        from .services.content_generator import get_content_generator_service
+        from .services.similarity_search import content_digest
         from .tasks import generate_campaign_content
 
         campaign = self.get_object()
 
-        use_ai = request.data.get("use_ai", True)
-        additional_instructions = request.data.get("additional_instructions")
-        async_generation = request.data.get("async_generation", False)
+        options = ContentGenerationSerializer(data=request.data)
+        options.is_valid(raise_exception=True)
+        use_ai = options.validated_data["use_ai"]
+        additional_instructions = options.validated_data["additional_instructions"]
+        async_generation = options.validated_data["async_generation"]
 
         # For async generation, queue as Celery task
         if async_generation:
@@ -605,7 +849,7 @@ An embedding is computed and stored for similarity search.
 
         # Synchronous generation
         try:
-            service = ContentGeneratorService()
+            service = get_content_generator_service()
             result, embedding = service.generate_and_embed(
                 campaign,
                 use_ai=use_ai,
@@ -613,10 +857,20 @@ An embedding is computed and stored for similarity search.
             )
 
             # Save content and embedding
+            # Write via a queryset UPDATE: skips model save signals and
+            # avoids pushing the unchanged columns back over the wire.
             campaign.generated_content = result.content
+            update_kwargs = {
+                "generated_content": result.content,
+            }
             if embedding:
+                # content_hash must track the embedding's source content,
+                # or bulk_compute_embeddings re-selects this campaign.
                 campaign.content_embedding = embedding
-            campaign.save(update_fields=["generated_content", "content_embedding", "updated_at"])
+                campaign.content_hash = content_digest(result.content)
+                update_kwargs["content_embedding"] = embedding
+                update_kwargs["content_hash"] = campaign.content_hash
+            LocationCampaign.objects.filter(pk=campaign.pk).update(**update_kwargs)
 
             response_data = {
                 "status": "success",
@@ -666,13 +920,16 @@ Uses AI to create a fresh version based on the template.
     @action(detail=True, methods=["post"])
     def regenerate_content(self, request, pk=None):
         """Regenerate content for a campaign."""
-        from .services.content_generator import ContentGeneratorService
+        from .services.content_generator import get_content_generator_service
+        from .services.similarity_search import content_digest
         from .tasks import generate_campaign_content
 
         campaign = self.get_object()
 
-        additional_instructions = request.data.get("additional_instructions")
-        async_generation = request.data.get("async_generation", False)
+        options = ContentGenerationSerializer(data=request.data)
+        options.is_valid(raise_exception=True)
+        additional_instructions = options.validated_data["additional_instructions"]
+        async_generation = options.validated_data["async_generation"]
 
         if async_generation:
             task = generate_campaign_content.delay(str(campaign.id))
@@ -683,17 +940,27 @@ Uses AI to create a fresh version based on the template.
             })
 
         try:
-            service = ContentGeneratorService()
+            service = get_content_generator_service()
             result, embedding = service.generate_and_embed(
                 campaign,
                 use_ai=True,
                 additional_instructions=additional_instructions,
             )
 
+            # Write via a queryset UPDATE: skips model save signals and
+            # avoids pushing the unchanged columns back over the wire.
             campaign.generated_content = result.content
+            update_kwargs = {
+                "generated_content": result.content,
+            }
             if embedding:
+                # content_hash must track the embedding's source content,
+                # or bulk_compute_embeddings re-selects this campaign.
                 campaign.content_embedding = embedding
-            campaign.save(update_fields=["generated_content", "content_embedding", "updated_at"])
+                campaign.content_hash = content_digest(result.content)
+                update_kwargs["content_embedding"] = embedding
+                update_kwargs["content_hash"] = campaign.content_hash
+            LocationCampaign.objects.filter(pk=campaign.pk).update(**update_kwargs)
 
             response_data = {
                 "status": "success",
@@ -762,13 +1029,15 @@ Uses AI to create a fresh version based on the template.
     @action(detail=True, methods=["get"])
     def similar_to(self, request, pk=None):
         """Find campaigns similar to this one."""
-        from .services.similarity_search import SimilaritySearchService
+        from .services.similarity_search import get_similarity_search_service
 
         campaign = self.get_object()
 
-        limit = int(request.query_params.get("limit", 5))
-        threshold = float(request.query_params.get("threshold", 0.7))
-        same_brand = request.query_params.get("same_brand", "false").lower() == "true"
+        query = SimilarCampaignQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        limit = query.validated_data["limit"]
+        threshold = query.validated_data["threshold"]
+        same_brand = query.validated_data["same_brand"]
 
         if campaign.content_embedding is None:
             return Response({
@@ -778,7 +1047,7 @@ Uses AI to create a fresh version based on the template.
             })
 
         try:
-            service = SimilaritySearchService()
+            service = get_similarity_search_service()
             similar = service.find_similar_to_campaign(
                 campaign_id=str(campaign.id),
                 limit=limit,
@@ -815,7 +1084,7 @@ Uses AI to create a fresh version based on the template.
     @action(detail=True, methods=["post"])
     def compute_embedding(self, request, pk=None):
         """Compute embedding for a campaign."""
-        from .services.similarity_search import SimilaritySearchService
+        from .services.similarity_search import get_similarity_search_service
 
         campaign = self.get_object()
 
@@ -826,7 +1095,7 @@ Uses AI to create a fresh version based on the template.
             )
 
         try:
-            service = SimilaritySearchService()
+            service = get_similarity_search_service()
             embedding = service.compute_embedding_for_campaign(campaign)
 
             if embedding:
@@ -881,15 +1150,17 @@ Provide either `query` (text) or `campaign_id` (UUID) to search.
     @action(detail=False, methods=["post"])
     def similar(self, request):
         """Search for similar campaigns."""
-        from .services.similarity_search import SimilaritySearchService
-
-        query = request.data.get("query")
-        campaign_id = request.data.get("campaign_id")
-        limit = request.data.get("limit", 10)
-        threshold = request.data.get("similarity_threshold", 0.7)
-        brand_id = request.data.get("brand_id")
-        same_brand_only = request.data.get("same_brand_only", False)
-        status_filter = request.data.get("status_filter")
+        from .services.similarity_search import get_similarity_search_service
+
+        body = SimilarSearchRequestSerializer(data=request.data)
+        body.is_valid(raise_exception=True)
+        query = body.validated_data["query"]
+        campaign_id = body.validated_data["campaign_id"]
+        limit = body.validated_data["limit"]
+        threshold = body.validated_data["similarity_threshold"]
+        brand_id = body.validated_data["brand_id"]
+        same_brand_only = body.validated_data["same_brand_only"]
+        status_filter = body.validated_data["status_filter"]
 
         if not query and not campaign_id:
             return Response(
@@ -898,11 +1169,11 @@ Provide either `query` (text) or `campaign_id` (UUID) to search.
             )
 
         try:
-            service = SimilaritySearchService()
+            service = get_similarity_search_service()
 
             if campaign_id:
                 similar = service.find_similar_to_campaign(
-                    campaign_id=campaign_id,
+                    campaign_id=str(campaign_id),
                     limit=limit,
                     similarity_threshold=threshold,
                     same_brand_only=same_brand_only,
@@ -913,7 +1184,7 @@ Provide either `query` (text) or `campaign_id` (UUID) to search.
                     query_text=query,
                     limit=limit,
                     similarity_threshold=threshold,
-                    brand_id=brand_id,
+                    brand_id=str(brand_id) if brand_id else None,
                     status_filter=status_filter,
                 )
 
@@ -964,21 +1235,26 @@ Compute embeddings for multiple campaigns at once.
     @action(detail=False, methods=["post"])
     def compute_embeddings(self, request):
         """Bulk compute embeddings for campaigns."""
-        from .services.similarity_search import SimilaritySearchService
+        from .services.similarity_search import get_similarity_search_service
+        from .tasks import bulk_compute_campaign_embeddings
 
         campaign_ids = request.data.get("campaign_ids")
         recompute = request.data.get("recompute", False)
         async_processing = request.data.get("async_processing", False)
 
+        # Bulk embedding can take minutes of model calls; queue it off the
+        # HTTP worker when the client opts in, mirroring the preview path.
         if async_processing:
-            # TODO: Implement async bulk embedding task
+            task = bulk_compute_campaign_embeddings.delay(
+                campaign_ids, recompute
+            )
             return Response({
                 "status": "queued",
-                "message": "Bulk embedding computation queued.",
+                "task_id": task.id,
             })
 
         try:
-            service = SimilaritySearchService()
+            service = get_similarity_search_service()
             result = service.bulk_compute_embeddings(
                 campaign_ids=campaign_ids,
                 recompute=recompute,
@@ -995,6 +1271,41 @@ Compute embeddings for multiple campaigns at once.
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @extend_schema(
+        summary="Poll bulk embedding task result",
+        description="Returns the result of a queued bulk embedding computation.",
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "status": {"type": "string"},
+                    "success": {"type": "integer"},
+                    "failed": {"type": "integer"},
+                    "skipped": {"type": "integer"},
+                    "total": {"type": "integer"},
+                },
+            }
+        },
+        tags=["location-campaigns"],
+    )
+    @action(detail=False, methods=["get"], url_path="embeddings_status/(?P<task_id>[^/.]+)")
+    def embeddings_status(self, request, task_id=None):
+        """Poll the result of a queued bulk embedding computation."""
+        from celery.result import AsyncResult
+
+        result = AsyncResult(task_id)
+
+        if not result.ready():
+            return Response({"status": "pending", "task_id": task_id})
+
+        if result.successful():
+            return Response(result.result)
+
+        return Response(
+            {"status": "error", "message": str(result.result)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
     # ========== HTML Email Endpoints ==========
 
     @extend_schema(
@@ -1034,7 +1345,7 @@ Also generates email subject line and preview text.
     @action(detail=True, methods=["post"])
     def generate_html_email(self, request, pk=None):
         """Generate HTML email content for a campaign."""
-        from .services.content_generator import ContentGeneratorService
+        from .services.content_generator import get_content_generator_service
         from .tasks import generate_html_email_content
 
         campaign = self.get_object()
@@ -1056,7 +1367,7 @@ Also generates email subject line and preview text.
             })
 
         try:
-            service = ContentGeneratorService()
+            service = get_content_generator_service()
             result = service.generate_full_email(campaign)
 
             campaign.generated_html_email = result["html"]
@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# Tables whose updated_at column is maintained by the trigger. Every
+# concrete model inheriting TimeStampedModel must be listed here.
+TIMESTAMPED_TABLES = [
+    "users",
+    "brands",
+    "locations",
+    "campaign_templates",
+    "location_campaigns",
+    "approval_steps",
+    "email_recipients",
+]
+
+CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION trigger_set_timestamp()
+RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CREATE_TRIGGER = """
+DROP TRIGGER IF EXISTS set_updated_at ON {table};
+CREATE TRIGGER set_updated_at
+BEFORE UPDATE ON {table}
+FOR EACH ROW EXECUTE FUNCTION trigger_set_timestamp();
+"""
+
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS set_updated_at ON {table};"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_enable_pgvector'),
+        ('users', '0003_timestamps_db_default'),
+        ('brands', '0004_timestamps_db_default'),
+        ('campaigns', '0008_timestamps_db_default'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_FUNCTION,
+            reverse_sql="DROP FUNCTION IF EXISTS trigger_set_timestamp();",
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=CREATE_TRIGGER.format(table=table),
+            reverse_sql=DROP_TRIGGER.format(table=table),
+        )
+        for table in TIMESTAMPED_TABLES
+    ]
@@ -1,13 +1,23 @@
 import uuid
 
 from django.db import models
+from django.db.models.functions import Now
 
 
 class TimeStampedModel(models.Model):
-    """Abstract base model with created/updated timestamps."""
-
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    """
+    Abstract base model with created/updated timestamps.
+
+    Both columns are database-defaulted instead of auto_now*: the server
+    fills created_at on INSERT and a BEFORE UPDATE trigger maintains
+    updated_at (see core migration 0002). That keeps the stamps correct
+    for bulk_create/bulk_update and raw SQL, which bypass the Python-side
+    auto_now machinery, and spares a per-row datetime computation on
+    every save.
+    """
+
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         abstract = True
@@ -1,17 +1,140 @@
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db.models import Count, Window
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 
+# How long a cached list count is served before it is recomputed. Writes
+# invalidate sooner via the per-table version key below.
+COUNT_CACHE_TIMEOUT = 60
+
+COUNT_CACHE_PREFIX = "listcount:v1"
+
+
+def _count_version_key(table: str) -> str:
+    return f"{COUNT_CACHE_PREFIX}:ver:{table}"
+
+
+def _invalidate_count_cache(sender, **kwargs):
+    """Bump the count-cache version for the sender's table on any write."""
+    key = _count_version_key(sender._meta.db_table)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def _ensure_invalidation_hooks(model):
+    """Connect write-invalidation signals for a paginated model once."""
+    uid = f"{COUNT_CACHE_PREFIX}:{model._meta.label_lower}"
+    post_save.connect(_invalidate_count_cache, sender=model, dispatch_uid=uid)
+    post_delete.connect(_invalidate_count_cache, sender=model, dispatch_uid=uid)
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that reuses COUNT(*) results across page requests.
+
+    Every page of a PageNumberPagination list normally re-runs the same
+    full-table aggregate; here the count is cached for 60 seconds keyed
+    on the compiled query, so paging through a list costs one COUNT
+    total. Saves and deletes on the model bump a per-table version key,
+    invalidating its cached counts immediately.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        model = getattr(queryset, "model", None)
+        if model is None or not hasattr(queryset, "query"):
+            return len(queryset)
+
+        table = model._meta.db_table
+        _ensure_invalidation_hooks(model)
+
+        version = cache.get(_count_version_key(table), 0)
+        digest = hashlib.sha256(str(queryset.query).encode()).hexdigest()
+        key = f"{COUNT_CACHE_PREFIX}:{table}:{version}:{digest}"
+
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
 
 class StandardPagination(PageNumberPagination):
     """Standard pagination for list endpoints."""
 
+    django_paginator_class = CachedCountPaginator
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
 
 
+class WindowCountPagination(StandardPagination):
+    """
+    Pagination that inlines the total into the page query.
+
+    Annotates the page rows with COUNT(*) OVER () instead of issuing a
+    separate SELECT COUNT(*), so each list response costs one query. The
+    response shape (count/next/previous/results) is unchanged.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            # "last" needs the count before the page can be located
+            return super().paginate_queryset(queryset, request, view)
+
+        try:
+            page_number = int(page_number)
+            if page_number < 1:
+                raise ValueError
+        except (TypeError, ValueError) as err:
+            raise NotFound(
+                self.invalid_page_message.format(page_number=page_number)
+            ) from err
+
+        offset = (page_number - 1) * page_size
+        results = list(
+            queryset.annotate(_pagination_total=Window(expression=Count("*")))[
+                offset : offset + page_size
+            ]
+        )
+
+        if results:
+            first = results[0]
+            # values() querysets yield dicts, model querysets yield instances
+            count = (
+                first["_pagination_total"]
+                if isinstance(first, dict)
+                else first._pagination_total
+            )
+        else:
+            count = 0
+            if page_number > 1:
+                raise NotFound(self.invalid_page_message.format(page_number=page_number))
+
+        paginator = Paginator(queryset, page_size)
+        paginator.count = count  # pre-seed the cached property; no COUNT query
+        self.page = Page(results, page_number, paginator)
+        self.request = request
+        return results
+
+
 class SmallPagination(PageNumberPagination):
     """Smaller pagination for nested resources."""
 
+    django_paginator_class = CachedCountPaginator
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
@@ -20,6 +143,7 @@ class SmallPagination(PageNumberPagination):
 class LargePagination(PageNumberPagination):
     """Larger pagination for bulk operations."""
 
+    django_paginator_class = CachedCountPaginator
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 200
@@ -1,29 +1,68 @@
+import uuid
+
 from rest_framework import permissions
 
 
+def get_accessible_brand_ids(request):
+    """
+    Return the set of brand ids the user can access, cached on the request.
+
+    Permission checks and queryset filtering both need the user's brands;
+    caching the id set on the request means the M2M table is read at most
+    once per request instead of once per check.
+    """
+    brand_ids = getattr(request, "_brand_access_cache", None)
+    if brand_ids is None:
+        brand_ids = set(request.user.brands.values_list("id", flat=True))
+        request._brand_access_cache = brand_ids
+    return brand_ids
+
+
+# One bit per role. Permission checks run on every authenticated
+# request, so the tiered "this role and above" tests are a single
+# integer AND against a precombined mask instead of string comparisons
+# and set membership. The role column itself stays a string; the mask
+# is derived per user instance (see User.role_mask).
+ADMIN_BIT = 1
+BRAND_MANAGER_BIT = 2
+LOCATION_MANAGER_BIT = 4
+VIEWER_BIT = 8
+
+ROLE_BITS = {
+    "admin": ADMIN_BIT,
+    "brand_manager": BRAND_MANAGER_BIT,
+    "location_manager": LOCATION_MANAGER_BIT,
+    "viewer": VIEWER_BIT,
+}
+
+BRAND_MANAGER_MASK = ADMIN_BIT | BRAND_MANAGER_BIT
+LOCATION_MANAGER_MASK = ADMIN_BIT | BRAND_MANAGER_BIT | LOCATION_MANAGER_BIT
+
+
+def _role_mask(user) -> int:
+    """Bitmask for the request user; 0 for anonymous users."""
+    return getattr(user, "role_mask", 0)
+
+
 class IsAdminUser(permissions.BasePermission):
     """Allow access only to admin users."""
 
     def has_permission(self, request, view):
-        return request.user and request.user.role == "admin"
+        return bool(_role_mask(request.user) & ADMIN_BIT)
 
 
 class IsBrandManager(permissions.BasePermission):
     """Allow access to brand managers and above."""
 
     def has_permission(self, request, view):
-        return request.user and request.user.role in ["admin", "brand_manager"]
+        return bool(_role_mask(request.user) & BRAND_MANAGER_MASK)
 
 
 class IsLocationManager(permissions.BasePermission):
     """Allow access to location managers and above."""
 
     def has_permission(self, request, view):
-        return request.user and request.user.role in [
-            "admin",
-            "brand_manager",
-            "location_manager",
-        ]
+        return bool(_role_mask(request.user) & LOCATION_MANAGER_MASK)
 
 
 class HasBrandAccess(permissions.BasePermission):
@@ -31,24 +70,29 @@ class HasBrandAccess(permissions.BasePermission):
 
     def has_permission(self, request, view):
         # Admins have access to all brands
-        if request.user.role == "admin":
+        if _role_mask(request.user) & ADMIN_BIT:
             return True
 
         # For nested views, check brand_id from URL
         brand_id = view.kwargs.get("brand_id") or view.kwargs.get("pk")
         if brand_id:
-            return request.user.brands.filter(id=brand_id).exists()
+            try:
+                return uuid.UUID(str(brand_id)) in get_accessible_brand_ids(request)
+            except ValueError:
+                return False
 
         return True
 
     def has_object_permission(self, request, view, obj):
         # Admins have access to all objects
-        if request.user.role == "admin":
+        if _role_mask(request.user) & ADMIN_BIT:
             return True
 
-        # Get the brand from the object
-        brand = getattr(obj, "brand", None) or obj
-        return request.user.brands.filter(id=brand.id).exists()
+        # Read the FK id off the object rather than obj.brand: the id is
+        # already on the row, while the relation triggers a query per
+        # object when the view didn't select_related it.
+        brand_id = getattr(obj, "brand_id", None) or obj.id
+        return brand_id in get_accessible_brand_ids(request)
 
 
 class ReadOnlyOrAdmin(permissions.BasePermission):
@@ -57,7 +101,7 @@ class ReadOnlyOrAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user and request.user.role == "admin"
+        return bool(_role_mask(request.user) & ADMIN_BIT)
 
 
 class BrandAccessMixin:
@@ -65,14 +109,12 @@ class BrandAccessMixin:
 
     def get_brand_queryset(self, queryset):
         """Filter queryset to only include user's accessible brands."""
-        user = self.request.user
-        if user.role == "admin":
+        if _role_mask(self.request.user) & ADMIN_BIT:
             return queryset
-        return queryset.filter(id__in=user.brands.all())
+        return queryset.filter(id__in=get_accessible_brand_ids(self.request))
 
     def get_location_queryset(self, queryset):
         """Filter queryset to only include locations from user's brands."""
-        user = self.request.user
-        if user.role == "admin":
+        if _role_mask(self.request.user) & ADMIN_BIT:
             return queryset
-        return queryset.filter(brand__in=user.brands.all())
+        return queryset.filter(brand_id__in=get_accessible_brand_ids(self.request))
@@ -0,0 +1,68 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+THEME_VALUES = {"system": 0, "light": 1, "dark": 2}
+
+BATCH_SIZE = 1000
+
+
+def copy_preferences(apps, schema_editor):
+    """Move each user's JSON preferences blob into its own row."""
+    User = apps.get_model("users", "User")
+    UserPreferences = apps.get_model("users", "UserPreferences")
+
+    rows = []
+    for user_id, prefs in User.objects.values_list("id", "preferences").iterator():
+        prefs = prefs or {}
+        notifications = prefs.get("notifications", {})
+        display = prefs.get("display", {})
+        rows.append(
+            UserPreferences(
+                user_id=user_id,
+                email_campaign_submitted=notifications.get(
+                    "email_campaign_submitted", True
+                ),
+                email_campaign_approved=notifications.get(
+                    "email_campaign_approved", True
+                ),
+                email_campaign_rejected=notifications.get(
+                    "email_campaign_rejected", True
+                ),
+                theme=THEME_VALUES.get(display.get("theme"), 0),
+            )
+        )
+        if len(rows) >= BATCH_SIZE:
+            UserPreferences.objects.bulk_create(rows, ignore_conflicts=True)
+            rows = []
+
+    if rows:
+        UserPreferences.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_timestamps_db_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPreferences',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='preferences', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('email_campaign_submitted', models.BooleanField(default=True)),
+                ('email_campaign_approved', models.BooleanField(default=True)),
+                ('email_campaign_rejected', models.BooleanField(default=True)),
+                ('theme', models.PositiveSmallIntegerField(choices=[(0, 'system'), (1, 'light'), (2, 'dark')], default=0)),
+            ],
+            options={
+                'db_table': 'user_preferences',
+            },
+        ),
+        migrations.RunPython(copy_preferences, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='user',
+            name='preferences',
+        ),
+    ]
@@ -0,0 +1,23 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Trigram-index the user search columns for fast substring search."""
+
+    dependencies = [
+        ("users", "0004_normalize_preferences"),
+        # pg_trgm is enabled by the campaigns template-name index migration.
+        ("campaigns", "0003_template_name_trgm_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["username", "email", "first_name", "last_name"],
+                name="user_search_trgm",
+                opclasses=["gin_trgm_ops"] * 4,
+            ),
+        ),
+    ]
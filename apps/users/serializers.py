@@ -4,6 +4,8 @@ from rest_framework import serializers
 
 from apps.brands.models import Brand
 
+from .models import UserPreferences
+
 User = get_user_model()
 
 
@@ -35,7 +37,10 @@ class UserSerializer(serializers.ModelSerializer):
     """Serializer for user details."""
 
     brands = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
-    preferences = UserPreferencesSerializer(read_only=True)
+    preferences = serializers.SerializerMethodField()
+
+    def get_preferences(self, obj) -> dict:
+        return obj.get_preferences().as_dict()
 
     class Meta:
         model = User
@@ -95,8 +100,19 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             first_name=validated_data.get("first_name", ""),
             last_name=validated_data.get("last_name", ""),
         )
+        # The response serializer reads brands and preferences, but a
+        # user created this instant has neither row. Seed the relation
+        # caches so rendering the response issues no SELECTs for rows
+        # that cannot exist yet.
+        user._prefetched_objects_cache = {"brands": user.brands.none()}
+        user.preferences = UserPreferences(user=user)
         return user
 
+    def to_representation(self, instance):
+        # Respond with the standard user shape directly, so the view
+        # doesn't build a second serializer for the response
+        return UserSerializer(instance, context=self.context).data
+
 
 class UserUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating user profile."""
@@ -105,6 +121,11 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ["first_name", "last_name", "email"]
 
+    def to_representation(self, instance):
+        # Same shape as UserSerializer without a second serializer pass
+        # in the view
+        return UserSerializer(instance, context=self.context).data
+
 
 class ChangePasswordSerializer(serializers.Serializer):
     """Serializer for password change."""
@@ -1,17 +1,48 @@
 """
 Tests for User model.
+
+Uses django.test.TestCase so the shared users and brands are created
+once per class in setUpTestData and restored per test by savepoint
+rollback, rather than rebuilt for every test.
 """
 
-import pytest
 from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.brands.models import Brand
 
 User = get_user_model()
 
 
-@pytest.mark.django_db
-class TestUserModel:
+class TestUserModel(TestCase):
     """Tests for the User model."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.brand = Brand.objects.create(
+            name="Test Brand",
+            slug="test-brand",
+            settings={"default_region": "southwest"},
+        )
+        cls.brand_two = Brand.objects.create(
+            name="Second Brand",
+            slug="second-brand",
+            settings={},
+        )
+        cls.admin_user = User.objects.create_user(
+            username="adminuser",
+            email="admin@test.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+        )
+        cls.brand_manager_user = User.objects.create_user(
+            username="brandmanager",
+            email="brandmanager@test.com",
+            password="bmpass123",
+            role=User.Role.BRAND_MANAGER,
+        )
+        cls.brand_manager_user.brands.add(cls.brand)
+
     def test_create_user(self):
         """Test creating a basic user."""
         user = User.objects.create_user(
@@ -45,30 +76,31 @@ class TestUserModel:
         assert User.Role.LOCATION_MANAGER == "location_manager"
         assert User.Role.VIEWER == "viewer"
 
-    def test_user_role_assignment(self, admin_user):
+    def test_user_role_assignment(self):
         """Test user role assignment."""
-        assert admin_user.role == User.Role.ADMIN
+        assert self.admin_user.role == User.Role.ADMIN
 
-    def test_user_brands_relationship(self, brand_manager_user, brand):
+    def test_user_brands_relationship(self):
         """Test user-brand many-to-many relationship."""
-        assert brand in brand_manager_user.brands.all()
-        assert brand_manager_user in brand.users.all()
+        assert self.brand in self.brand_manager_user.brands.all()
+        assert self.brand_manager_user in self.brand.users.all()
 
-    def test_user_multiple_brands(self, db, brand, brand_two):
+    def test_user_multiple_brands(self):
         """Test user can be assigned to multiple brands."""
         user = User.objects.create_user(
             username="multiuser",
             email="multi@test.com",
             password="pass123",
         )
-        user.brands.add(brand, brand_two)
+        user.brands.add(self.brand, self.brand_two)
         assert user.brands.count() == 2
 
-    def test_user_timestamps(self, admin_user):
+    def test_user_timestamps(self):
         """Test that created_at and updated_at are set."""
-        assert admin_user.created_at is not None
-        assert admin_user.updated_at is not None
+        self.admin_user.refresh_from_db(fields=["created_at", "updated_at"])
+        assert self.admin_user.created_at is not None
+        assert self.admin_user.updated_at is not None
 
-    def test_user_str_representation(self, admin_user):
+    def test_user_str_representation(self):
         """Test user string representation."""
-        assert str(admin_user) == "admin"
+        assert str(self.admin_user) == "adminuser"
@@ -1,22 +1,58 @@
 """
 Tests for User API views.
+
+These classes use django.test.TestCase so setUpTestData builds the
+shared users once per class inside the class-wide transaction; each
+test then runs in a savepoint rolled back on teardown, instead of
+re-creating the rows per test.
 """
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.brands.models import Brand
 
 User = get_user_model()
 
 
-@pytest.mark.django_db
-class TestRegisterView:
+def make_admin_user():
+    """Create the standard admin user for these view tests."""
+    return User.objects.create_user(
+        username="admin",
+        email="admin@test.com",
+        password="adminpass123",
+        role=User.Role.ADMIN,
+        first_name="Admin",
+        last_name="User",
+    )
+
+
+def authenticated_client(user):
+    """Return an APIClient authenticated as the given user."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+class TestRegisterView(TestCase):
     """Tests for user registration endpoint."""
 
     url = "/api/v1/auth/register/"
 
-    def test_register_success(self, api_client):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = make_admin_user()
+
+    def setUp(self):
+        self.api_client = APIClient()
+
+    @pytest.mark.max_queries(10)
+    def test_register_success(self):
         """Test successful user registration."""
         data = {
             "username": "newuser",
@@ -26,13 +62,13 @@ class TestRegisterView:
             "first_name": "New",
             "last_name": "User",
         }
-        response = api_client.post(self.url, data)
+        response = self.api_client.post(self.url, data)
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["message"] == "User registered successfully."
         assert response.data["user"]["username"] == "newuser"
         assert User.objects.filter(username="newuser").exists()
 
-    def test_register_password_mismatch(self, api_client):
+    def test_register_password_mismatch(self):
         """Test registration fails with password mismatch."""
         data = {
             "username": "newuser",
@@ -40,10 +76,10 @@ class TestRegisterView:
             "password": "securepass123",
             "password_confirm": "differentpass",
         }
-        response = api_client.post(self.url, data)
+        response = self.api_client.post(self.url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_register_duplicate_username(self, api_client, admin_user):
+    def test_register_duplicate_username(self):
         """Test registration fails with duplicate username."""
         data = {
             "username": "admin",  # Already exists
@@ -51,136 +87,217 @@ class TestRegisterView:
             "password": "securepass123",
             "password_confirm": "securepass123",
         }
-        response = api_client.post(self.url, data)
+        response = self.api_client.post(self.url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_register_missing_fields(self, api_client):
+    def test_register_missing_fields(self):
         """Test registration fails with missing required fields."""
         data = {"username": "newuser"}
-        response = api_client.post(self.url, data)
+        response = self.api_client.post(self.url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.django_db
-class TestCurrentUserView:
+class TestCurrentUserView(TestCase):
     """Tests for current user endpoint."""
 
     url = "/api/v1/auth/me/"
 
-    def test_get_current_user(self, admin_client, admin_user):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = make_admin_user()
+
+    def setUp(self):
+        self.api_client = APIClient()
+        self.admin_client = authenticated_client(self.admin_user)
+
+    @pytest.mark.max_queries(8)
+    def test_get_current_user(self):
         """Test getting current user details."""
-        response = admin_client.get(self.url)
+        response = self.admin_client.get(self.url)
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["username"] == admin_user.username
-        assert response.data["email"] == admin_user.email
-        assert response.data["role"] == admin_user.role
+        assert response.data["username"] == self.admin_user.username
+        assert response.data["email"] == self.admin_user.email
+        assert response.data["role"] == self.admin_user.role
 
-    def test_get_current_user_unauthenticated(self, api_client):
+    def test_get_current_user_unauthenticated(self):
         """Test unauthenticated access is denied."""
-        response = api_client.get(self.url)
+        response = self.api_client.get(self.url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_update_current_user(self, admin_client, admin_user):
+    def test_update_current_user(self):
         """Test updating current user profile."""
         data = {"first_name": "Updated", "last_name": "Name"}
-        response = admin_client.patch(self.url, data)
+        response = self.admin_client.patch(self.url, data)
         assert response.status_code == status.HTTP_200_OK
-        admin_user.refresh_from_db()
-        assert admin_user.first_name == "Updated"
-        assert admin_user.last_name == "Name"
+        self.admin_user.refresh_from_db(fields=["first_name", "last_name"])
+        assert self.admin_user.first_name == "Updated"
+        assert self.admin_user.last_name == "Name"
 
-    def test_update_current_user_email(self, admin_client, admin_user):
+    def test_update_current_user_email(self):
         """Test updating user email."""
         data = {"email": "newemail@test.com"}
-        response = admin_client.patch(self.url, data)
+        response = self.admin_client.patch(self.url, data)
         assert response.status_code == status.HTTP_200_OK
-        admin_user.refresh_from_db()
-        assert admin_user.email == "newemail@test.com"
+        self.admin_user.refresh_from_db(fields=["email"])
+        assert self.admin_user.email == "newemail@test.com"
 
 
-@pytest.mark.django_db
-class TestChangePasswordView:
+class TestChangePasswordView(TestCase):
     """Tests for password change endpoint."""
 
     url = "/api/v1/auth/change-password/"
 
-    def test_change_password_success(self, admin_client, admin_user):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = make_admin_user()
+
+    def setUp(self):
+        self.api_client = APIClient()
+        self.admin_client = authenticated_client(self.admin_user)
+
+    def test_change_password_success(self):
         """Test successful password change."""
         data = {
             "old_password": "adminpass123",
             "new_password": "newsecurepass123",
             "new_password_confirm": "newsecurepass123",
         }
-        response = admin_client.post(self.url, data)
+        response = self.admin_client.post(self.url, data)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Password changed successfully."
-        admin_user.refresh_from_db()
-        assert admin_user.check_password("newsecurepass123")
+        self.admin_user.refresh_from_db(fields=["password"])
+        assert self.admin_user.check_password("newsecurepass123")
 
-    def test_change_password_wrong_old(self, admin_client):
+    def test_change_password_wrong_old(self):
         """Test password change fails with wrong old password."""
         data = {
             "old_password": "wrongpassword",
             "new_password": "newsecurepass123",
             "new_password_confirm": "newsecurepass123",
         }
-        response = admin_client.post(self.url, data)
+        response = self.admin_client.post(self.url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_change_password_weak_password(self, admin_client):
+    def test_change_password_weak_password(self):
         """Test password change fails with weak password."""
         data = {
             "old_password": "adminpass123",
             "new_password": "123",  # Too weak
         }
-        response = admin_client.post(self.url, data)
+        response = self.admin_client.post(self.url, data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_change_password_unauthenticated(self, api_client):
+    def test_change_password_unauthenticated(self):
         """Test unauthenticated access is denied."""
         data = {
             "old_password": "pass",
             "new_password": "newpass123",
             "new_password_confirm": "newpass123",
         }
-        response = api_client.post(self.url, data)
+        response = self.api_client.post(self.url, data)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.django_db
-class TestTokenAuth:
+class TestUserViewSet(TestCase):
+    """Tests for the admin user management endpoint."""
+
+    url = "/api/v1/users/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_user(
+            username="staffadmin",
+            email="staffadmin@test.com",
+            password="adminpass123",
+            role=User.Role.ADMIN,
+            is_staff=True,
+        )
+        cls.brand = Brand.objects.create(
+            name="Guard Brand",
+            slug="guard-brand",
+            settings={},
+        )
+
+    def setUp(self):
+        self.admin_client = authenticated_client(self.admin_user)
+
+    def _create_users(self, start, count):
+        for i in range(start, start + count):
+            user = User.objects.create_user(
+                username=f"listeduser{i}",
+                email=f"listeduser{i}@test.com",
+                password="pass12345",
+            )
+            user.brands.add(self.brand)
+
+    def _list_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.admin_client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(ctx.captured_queries)
+
+    def test_list_users(self):
+        """Test listing users includes brand details."""
+        self._create_users(0, 2)
+        response = self.admin_client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 3
+        by_name = {row["username"]: row for row in response.data["results"]}
+        assert by_name["listeduser0"]["brands_detail"] == [
+            {"id": str(self.brand.id), "name": "Guard Brand"}
+        ]
+
+    def test_list_query_count_constant(self):
+        """The list must not issue extra queries per user row (N+1 guard)."""
+        self._create_users(0, 3)
+        with_few = self._list_query_count()
+
+        self._create_users(3, 10)
+        with_many = self._list_query_count()
+
+        assert with_many == with_few
+
+
+class TestTokenAuth(TestCase):
     """Tests for JWT token authentication."""
 
     token_url = "/api/v1/auth/token/"
     refresh_url = "/api/v1/auth/token/refresh/"
 
-    def test_obtain_token(self, api_client, admin_user):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = make_admin_user()
+
+    def setUp(self):
+        self.api_client = APIClient()
+
+    def test_obtain_token(self):
         """Test obtaining JWT token with valid credentials."""
         data = {"username": "admin", "password": "adminpass123"}
-        response = api_client.post(self.token_url, data)
+        response = self.api_client.post(self.token_url, data)
         assert response.status_code == status.HTTP_200_OK
         assert "access" in response.data
         assert "refresh" in response.data
 
-    def test_obtain_token_invalid_credentials(self, api_client, admin_user):
+    def test_obtain_token_invalid_credentials(self):
         """Test token request fails with invalid credentials."""
         data = {"username": "admin", "password": "wrongpassword"}
-        response = api_client.post(self.token_url, data)
+        response = self.api_client.post(self.token_url, data)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_refresh_token(self, api_client, admin_user):
+    def test_refresh_token(self):
         """Test refreshing JWT token."""
         # First get tokens
         data = {"username": "admin", "password": "adminpass123"}
-        response = api_client.post(self.token_url, data)
+        response = self.api_client.post(self.token_url, data)
         refresh_token = response.data["refresh"]
 
         # Then refresh
-        response = api_client.post(self.refresh_url, {"refresh": refresh_token})
+        response = self.api_client.post(self.refresh_url, {"refresh": refresh_token})
         assert response.status_code == status.HTTP_200_OK
         assert "access" in response.data
 
-    def test_refresh_token_invalid(self, api_client):
+    def test_refresh_token_invalid(self):
         """Test refresh fails with invalid token."""
-        response = api_client.post(self.refresh_url, {"refresh": "invalidtoken"})
+        response = self.api_client.post(self.refresh_url, {"refresh": "invalidtoken"})
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,10 +1,16 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, permissions, status, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.brands.models import Brand
+
+from .models import UserPreferences
 from .serializers import (
     ChangePasswordSerializer,
     UserManagementSerializer,
@@ -16,6 +22,20 @@ from .serializers import (
 
 User = get_user_model()
 
+ME_CACHE_TIMEOUT = 300
+
+
+def _me_cache_key(user) -> str:
+    """
+    Cache key for the serialized /auth/me/ payload.
+
+    updated_at is part of the key, so any save of the user row (the
+    database trigger bumps the column on every UPDATE) lands on a fresh
+    key without explicit invalidation. Preferences live in their own
+    table and are deleted from the cache explicitly on PATCH.
+    """
+    return f"me:{user.pk}:{int(user.updated_at.timestamp())}"
+
 
 class RegisterView(generics.CreateAPIView):
     """User registration endpoint."""
@@ -26,11 +46,11 @@ class RegisterView(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
+        serializer.save()
         return Response(
             {
                 "message": "User registered successfully.",
-                "user": UserSerializer(user).data,
+                "user": serializer.data,
             },
             status=status.HTTP_201_CREATED,
         )
@@ -43,8 +63,15 @@ class CurrentUserView(APIView):
 
     def get(self, request):
         """Get current user details."""
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+        # /auth/me/ is the most-called endpoint and its payload only
+        # changes when the user row does, so serve the serialized dict
+        # from cache and rebuild it on a key miss.
+        cache_key = _me_cache_key(request.user)
+        data = cache.get(cache_key)
+        if data is None:
+            data = UserSerializer(request.user).data
+            cache.set(cache_key, data, ME_CACHE_TIMEOUT)
+        return Response(data)
 
     def patch(self, request):
         """Update current user profile."""
@@ -55,7 +82,7 @@ class CurrentUserView(APIView):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
-        return Response(UserSerializer(request.user).data)
+        return Response(serializer.data)
 
 
 class ChangePasswordView(APIView):
@@ -79,10 +106,27 @@ class ChangePasswordView(APIView):
 class UserViewSet(viewsets.ModelViewSet):
     """Admin viewset for managing users."""
 
-    queryset = User.objects.all().prefetch_related("brands")
+    # only() keeps the user rows down to the serialized columns, and the
+    # narrowed Prefetch resolves both brands and brands_detail from one
+    # extra query regardless of page size.
+    queryset = User.objects.only(
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "role",
+        "is_active",
+        "date_joined",
+    ).prefetch_related(
+        Prefetch("brands", queryset=Brand.objects.only("id", "name"))
+    )
     serializer_class = UserManagementSerializer
     permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # SearchFilter's ILIKE '%term%' per column is served by the
+    # user_search_trgm GIN index; substring semantics are the API
+    # contract, so no TrigramSimilarity rewrite.
     search_fields = ["username", "email", "first_name", "last_name"]
     filterset_fields = ["role", "is_active"]
     ordering_fields = ["username", "date_joined", "role"]
@@ -95,8 +139,6 @@ class UserViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         """Prevent self-deletion."""
         if instance == self.request.user:
-            from rest_framework.exceptions import ValidationError
-
             raise ValidationError({"detail": "You cannot delete your own account."})
         super().perform_destroy(instance)
 
@@ -108,22 +150,28 @@ class UserPreferencesView(APIView):
 
     def get(self, request):
         """Get current user preferences."""
-        return Response(request.user.preferences)
+        return Response(request.user.get_preferences().as_dict())
 
     def patch(self, request):
         """Update current user preferences (partial update)."""
         serializer = UserPreferencesSerializer(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
 
-        # Deep merge with existing preferences
-        current_prefs = request.user.preferences.copy()
-        for key, value in serializer.validated_data.items():
-            if key in current_prefs and isinstance(current_prefs[key], dict):
-                current_prefs[key].update(value)
-            else:
-                current_prefs[key] = value
+        updates = dict(serializer.validated_data.get("notifications", {}))
+        display = serializer.validated_data.get("display", {})
+        if "theme" in display:
+            updates["theme"] = UserPreferences.THEME_VALUES[display["theme"]]
+
+        # update_or_create writes only the submitted columns, so two
+        # concurrent PATCHes touching different keys don't clobber each
+        # other the way a read-modify-write of the whole row would.
+        prefs, _ = UserPreferences.objects.update_or_create(
+            user=request.user, defaults=updates
+        )
 
-        request.user.preferences = current_prefs
-        request.user.save(update_fields=["preferences"])
+        # Preference writes don't touch the user row, so the cached
+        # /auth/me/ payload (which embeds preferences) must be dropped
+        # by hand.
+        cache.delete(_me_cache_key(request.user))
 
-        return Response(request.user.preferences)
+        return Response(prefs.as_dict())
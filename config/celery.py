@@ -15,17 +15,21 @@ app.autodiscover_tasks()
 
 
 # Celery Beat Schedule - Periodic Tasks
+#
+# Campaign activation/completion is primarily event-driven: one-shot
+# apply_async(eta=...) messages are queued at schedule/activate time, so
+# these sweeps run hourly only as a safety net for lost eta messages.
 app.conf.beat_schedule = {
-    # Check for campaigns that need to be activated
+    # Backup sweep for campaigns that need to be activated
     "activate-scheduled-campaigns": {
         "task": "apps.campaigns.tasks.activate_scheduled_campaigns",
-        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+        "schedule": crontab(minute=0),  # Hourly
         "options": {"queue": "default"},
     },
-    # Check for campaigns that need to be completed
+    # Backup sweep for campaigns that need to be completed
     "complete-expired-campaigns": {
         "task": "apps.campaigns.tasks.complete_expired_campaigns",
-        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+        "schedule": crontab(minute=5),  # Hourly, offset from activation
         "options": {"queue": "default"},
     },
     # Send daily digest of pending approvals
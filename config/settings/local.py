@@ -6,12 +6,29 @@ from .base import *  # noqa: F401, F403
 
 DEBUG = True
 
-# Django Debug Toolbar
-INSTALLED_APPS += ["debug_toolbar"]  # noqa: F405
-MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")  # noqa: F405
+# Django Debug Toolbar — opt-in via ENABLE_DEBUG_TOOLBAR=1. The toolbar
+# middleware instruments every query and template render whether or not
+# the panel is open, which skews local profiling numbers.
+if config("ENABLE_DEBUG_TOOLBAR", default=False, cast=bool):  # noqa: F405
+    INSTALLED_APPS += ["debug_toolbar"]  # noqa: F405
+    MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")  # noqa: F405
+
+# N+1 lazy-load detection: raises in development when a relation is
+# loaded lazily per row instead of select_related/prefetch_related
+INSTALLED_APPS += ["zeal"]  # noqa: F405
+MIDDLEWARE.append("zeal.middleware.zeal_middleware")  # noqa: F405
 
 INTERNAL_IPS = ["127.0.0.1", "localhost"]
 
+# Persistent database connections: reuse each worker's connection for up
+# to 60s instead of paying the TCP + auth handshake on every request.
+# Health checks revalidate a held connection before reuse so a restarted
+# Postgres doesn't surface as stale-connection errors. For pooling beyond
+# per-worker reuse (many workers, low max_connections), front Postgres
+# with pgbouncer and point DB_HOST/DB_PORT at it.
+DATABASES["default"]["CONN_MAX_AGE"] = 60  # noqa: F405
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True  # noqa: F405
+
 # Email backend for development
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -0,0 +1,27 @@
+"""
+Test settings for StoreSync project.
+
+Used by pytest (see DJANGO_SETTINGS_MODULE in pyproject.toml).
+"""
+
+from .base import *  # noqa: F401, F403
+
+DEBUG = False
+
+# Swap the slow key-derivation hasher for a single MD5 call: hashing is
+# the hottest CPU cost in the auth tests, and tests only need passwords
+# to round-trip, not to resist offline attack. AUTH_PASSWORD_VALIDATORS
+# are inherited unchanged so validator behavior stays covered.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# N+1 lazy-load detection; the conftest autouse fixture wraps each test
+# in zeal_context so per-row lazy loads fail the test
+INSTALLED_APPS += ["zeal"]  # noqa: F405
+
+# Process-local cache so response/count caching works in tests without a
+# Redis service
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
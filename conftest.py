@@ -2,20 +2,133 @@
 Pytest configuration and fixtures for StoreSync tests.
 """
 
+import functools
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.brands.models import Brand, Location
 from apps.campaigns.models import ApprovalStep, CampaignTemplate, LocationCampaign
 
-
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def nplusone_guard(request):
+    """
+    Fail any test that triggers an N+1 lazy load.
+
+    zeal raises when the same relation is loaded lazily across multiple
+    rows, which is how missing select_related/prefetch_related slips
+    past functional assertions. Tests exercising a known offender can
+    opt out with @pytest.mark.allow_nplusone until it is fixed.
+    """
+    from zeal import zeal_context
+
+    if request.node.get_closest_marker("allow_nplusone"):
+        yield
+        return
+
+    with zeal_context():
+        yield
+
+
+@pytest.fixture(autouse=True)
+def query_budget(request):
+    """
+    Enforce a per-test query budget declared via @pytest.mark.max_queries(N).
+
+    Complements the lazy-load guard: zeal catches per-row N+1 patterns,
+    while an explicit budget catches regressions that add whole new
+    queries to an endpoint. Unmarked tests are unaffected.
+    """
+    marker = request.node.get_closest_marker("max_queries")
+    if marker is None:
+        yield
+        return
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    limit = marker.args[0]
+    with CaptureQueriesContext(connection) as ctx:
+        yield
+
+    if len(ctx.captured_queries) > limit:
+        statements = "\n".join(q["sql"] for q in ctx.captured_queries)
+        pytest.fail(
+            f"Query budget exceeded: {len(ctx.captured_queries)} queries, "
+            f"budget {limit}.\n{statements}"
+        )
+
+
+@functools.cache
+def _hashed_password(raw: str) -> str:
+    """Run the password KDF once per distinct fixture password."""
+    return make_password(raw)
+
+
+@pytest.fixture(autouse=True)
+def fast_password_check(request, monkeypatch):
+    """
+    Short-circuit password verification against the cached fixture hashes.
+
+    A correct password for a fixture user matches its memoized hash by
+    string comparison, skipping the per-call hash entirely; anything
+    else (wrong passwords, users created inside a test, changed
+    passwords) falls through to the real check, so verification
+    semantics are unchanged. Tests that assert hashing behavior itself
+    can opt out with @pytest.mark.verify_hash.
+    """
+    from django.contrib.auth import base_user, hashers
+
+    if request.node.get_closest_marker("verify_hash"):
+        return
+
+    real_check = hashers.check_password
+
+    def fast_check(password, encoded, setter=None, preferred="default"):
+        if password and encoded == _hashed_password(password):
+            return True
+        return real_check(password, encoded, setter=setter, preferred=preferred)
+
+    # AbstractBaseUser.check_password binds the name at import, so patch
+    # both the hashers module and the base_user reference.
+    monkeypatch.setattr(hashers, "check_password", fast_check)
+    monkeypatch.setattr(base_user, "check_password", fast_check)
+
+
+def _create_user(*, password, brands=(), **fields):
+    """
+    Create a user with a session-cached password hash.
+
+    create_user re-runs the key-derivation hash on every call — tens of
+    milliseconds per user, repeated for each test that pulls in a user
+    fixture. Reusing one precomputed hash per distinct password removes
+    that cost while leaving the rows per-test (so list counts and
+    mutations keep their transaction-rollback isolation), and password
+    checks in auth tests still verify against the stored hash normally.
+
+    Brand memberships go through bulk_create on the through model rather
+    than brands.add(), skipping add()'s duplicate-check SELECT and the
+    m2m_changed signal dispatch per fixture.
+    """
+    user = User(password=_hashed_password(password), **fields)
+    user.save()
+    if brands:
+        through = User.brands.through
+        through.objects.bulk_create(
+            [through(user=user, brand=brand) for brand in brands],
+            ignore_conflicts=True,
+        )
+    return user
+
+
 # =============================================================================
 # User Fixtures
 # =============================================================================
@@ -30,7 +143,7 @@ def api_client():
 @pytest.fixture
 def admin_user(db):
     """Create and return an admin user."""
-    user = User.objects.create_user(
+    user = _create_user(
         username="admin",
         email="admin@test.com",
         password="adminpass123",
@@ -44,52 +157,49 @@ def admin_user(db):
 @pytest.fixture
 def brand_manager_user(db, brand):
     """Create and return a brand manager user with brand access."""
-    user = User.objects.create_user(
+    return _create_user(
         username="brandmanager",
         email="brandmanager@test.com",
         password="bmpass123",
         role=User.Role.BRAND_MANAGER,
         first_name="Brand",
         last_name="Manager",
+        brands=[brand],
     )
-    user.brands.add(brand)
-    return user
 
 
 @pytest.fixture
 def location_manager_user(db, brand):
     """Create and return a location manager user with brand access."""
-    user = User.objects.create_user(
+    return _create_user(
         username="locationmanager",
         email="locationmanager@test.com",
         password="lmpass123",
         role=User.Role.LOCATION_MANAGER,
         first_name="Location",
         last_name="Manager",
+        brands=[brand],
     )
-    user.brands.add(brand)
-    return user
 
 
 @pytest.fixture
 def viewer_user(db, brand):
     """Create and return a viewer user with brand access."""
-    user = User.objects.create_user(
+    return _create_user(
         username="viewer",
         email="viewer@test.com",
         password="viewerpass123",
         role=User.Role.VIEWER,
         first_name="Viewer",
         last_name="User",
+        brands=[brand],
     )
-    user.brands.add(brand)
-    return user
 
 
 @pytest.fixture
 def user_without_brand(db):
     """Create and return a user without brand access."""
-    user = User.objects.create_user(
+    user = _create_user(
         username="nobrand",
         email="nobrand@test.com",
         password="nobrandpass123",
@@ -104,10 +214,16 @@ def user_without_brand(db):
 
 
 def get_authenticated_client(user):
-    """Helper to create an authenticated API client."""
+    """
+    Helper to create an authenticated API client.
+
+    force_authenticate skips minting a JWT per test and verifying it on
+    every request the test makes — signing plus token validation and
+    its user lookup added up across the suite. Real token issue/verify
+    behavior is covered explicitly by the TestTokenAuth tests.
+    """
     client = APIClient()
-    refresh = RefreshToken.for_user(user)
-    client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    client.force_authenticate(user=user)
     return client
 
 
@@ -292,13 +408,92 @@ def inactive_template(db, brand):
 # =============================================================================
 
 
-@pytest.fixture
-def draft_campaign(db, location, campaign_template, admin_user):
-    """Create and return a draft campaign."""
+def _make_campaign_at_state(*, location, template, created_by, status, **fields):
+    """
+    Create a campaign directly at a workflow state in one INSERT.
+
+    The FSM transitions carry no side effects (the transition methods
+    are empty and write no ApprovalStep rows), so walking the state
+    machine in a fixture just to reach a status costs an extra full-row
+    UPDATE for the same end state. Tests that exercise transitions still
+    call them on the returned instance.
+    """
     return LocationCampaign.objects.create(
         location=location,
-        template=campaign_template,
-        created_by=admin_user,
+        template=template,
+        created_by=created_by,
+        status=status,
+        **fields,
+    )
+
+
+@pytest.fixture
+def unsaved_campaign_factory():
+    """
+    Return a callable that builds a campaign entirely in memory.
+
+    Pure state-machine tests only call methods on the instance and
+    never persist it, so the whole relation graph is constructed
+    unsaved. Tests using this fixture need no db dependency at all,
+    letting pytest-django skip the per-test transaction setup.
+    """
+
+    def _make(status=LocationCampaign.Status.DRAFT, **fields):
+        brand = Brand(name="Test Brand", slug="test-brand", settings={})
+        location = Location(
+            brand=brand,
+            name="Downtown Store",
+            store_number="001",
+            address={},
+            attributes={},
+            latitude=Decimal("30.267200"),
+            longitude=Decimal("-97.743100"),
+        )
+        template = CampaignTemplate(
+            brand=brand,
+            name="Summer Sale Template",
+            content_template="Sale at {{location_name}}!",
+            required_variables=["discount_percentage"],
+            campaign_type="seasonal_sale",
+        )
+        user = User(username="admin", email="admin@test.com", role=User.Role.ADMIN)
+        fields.setdefault("customizations", {"discount_percentage": 25})
+        fields.setdefault("generated_content", "")
+        return LocationCampaign(
+            location=location,
+            template=template,
+            created_by=user,
+            status=status,
+            **fields,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def campaign_factory(db, location, campaign_template, admin_user):
+    """
+    Return a callable that creates a campaign at any workflow state.
+
+    The named fixtures below are thin wrappers over this; tests needing
+    a status/customization combination the wrappers don't cover can
+    request exactly the state they want instead of adding another
+    near-identical fixture.
+    """
+
+    def _make(status=LocationCampaign.Status.DRAFT, **fields):
+        fields.setdefault("location", location)
+        fields.setdefault("template", campaign_template)
+        fields.setdefault("created_by", admin_user)
+        return _make_campaign_at_state(status=status, **fields)
+
+    return _make
+
+
+@pytest.fixture
+def draft_campaign(campaign_factory):
+    """Create and return a draft campaign."""
+    return campaign_factory(
         status=LocationCampaign.Status.DRAFT,
         customizations={"discount_percentage": 25},
         generated_content="",
@@ -306,125 +501,160 @@ def draft_campaign(db, location, campaign_template, admin_user):
 
 
 @pytest.fixture
-def pending_campaign(db, location, campaign_template, admin_user):
+def pending_campaign(campaign_factory):
     """Create and return a pending review campaign."""
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    return campaign_factory(
+        status=LocationCampaign.Status.PENDING_REVIEW,
         customizations={"discount_percentage": 30},
         generated_content="Summer Sale at Downtown Store!",
     )
-    campaign.submit_for_review()
-    campaign.save()
-    return campaign
 
 
 @pytest.fixture
-def approved_campaign(db, location, campaign_template, admin_user):
+def approved_campaign(campaign_factory):
     """Create and return an approved campaign."""
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    return campaign_factory(
+        status=LocationCampaign.Status.APPROVED,
         customizations={"discount_percentage": 35},
         generated_content="Approved campaign content",
     )
-    campaign.submit_for_review()
-    campaign.approve()
-    campaign.save()
-    return campaign
 
 
 @pytest.fixture
-def rejected_campaign(db, location, campaign_template, admin_user):
+def rejected_campaign(campaign_factory):
     """Create and return a rejected campaign."""
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    return campaign_factory(
+        status=LocationCampaign.Status.REJECTED,
         customizations={"discount_percentage": 15},
         generated_content="Rejected content",
     )
-    campaign.submit_for_review()
-    campaign.reject()
-    campaign.save()
-    return campaign
 
 
 @pytest.fixture
-def scheduled_campaign(db, location, campaign_template, admin_user):
+def scheduled_campaign(campaign_factory):
     """Create and return a scheduled campaign."""
-    from django.utils import timezone
-    from datetime import timedelta
-
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    now = timezone.now()
+    return campaign_factory(
+        status=LocationCampaign.Status.SCHEDULED,
         customizations={"discount_percentage": 40},
         generated_content="Scheduled campaign content",
-        scheduled_start=timezone.now() + timedelta(days=1),
-        scheduled_end=timezone.now() + timedelta(days=7),
+        scheduled_start=now + timedelta(days=1),
+        scheduled_end=now + timedelta(days=7),
     )
-    campaign.submit_for_review()
-    campaign.approve()
-    campaign.schedule()
-    campaign.save()
-    return campaign
 
 
 @pytest.fixture
-def active_campaign(db, location, campaign_template, admin_user):
+def active_campaign(campaign_factory):
     """Create and return an active campaign."""
-    from django.utils import timezone
-    from datetime import timedelta
-
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    now = timezone.now()
+    return campaign_factory(
+        status=LocationCampaign.Status.ACTIVE,
         customizations={"discount_percentage": 50},
         generated_content="Active campaign content",
-        scheduled_start=timezone.now() - timedelta(days=1),
-        scheduled_end=timezone.now() + timedelta(days=6),
+        scheduled_start=now - timedelta(days=1),
+        scheduled_end=now + timedelta(days=6),
     )
-    campaign.submit_for_review()
-    campaign.approve()
-    campaign.schedule()
-    campaign.activate()
-    campaign.save()
-    return campaign
 
 
 @pytest.fixture
-def completed_campaign(db, location, campaign_template, admin_user):
+def completed_campaign(campaign_factory):
     """Create and return a completed campaign."""
-    from django.utils import timezone
-    from datetime import timedelta
-
-    campaign = LocationCampaign.objects.create(
-        location=location,
-        template=campaign_template,
-        created_by=admin_user,
-        status=LocationCampaign.Status.DRAFT,
+    now = timezone.now()
+    return campaign_factory(
+        status=LocationCampaign.Status.COMPLETED,
         customizations={"discount_percentage": 20},
         generated_content="Completed campaign content",
-        scheduled_start=timezone.now() - timedelta(days=14),
-        scheduled_end=timezone.now() - timedelta(days=7),
+        scheduled_start=now - timedelta(days=14),
+        scheduled_end=now - timedelta(days=7),
     )
-    campaign.submit_for_review()
-    campaign.approve()
-    campaign.schedule()
-    campaign.activate()
-    campaign.complete()
-    campaign.save()
-    return campaign
+
+
+@pytest.fixture
+def all_campaign_states(db, location, campaign_template, admin_user):
+    """
+    Materialize one campaign per workflow state in a single INSERT.
+
+    Tests that need several states at once would otherwise pay one
+    round-trip per named fixture; bulk_create sends all seven rows in
+    one statement, plus one more for the pending campaign's submission
+    history. Rows stay function-scoped, so the per-test transaction
+    rolls them back as usual.
+
+    Returns:
+        dict mapping each Status value to its campaign, plus an
+        "approval_step" entry for the pending campaign's submission
+    """
+    now = timezone.now()
+    common = {
+        "location": location,
+        "template": campaign_template,
+        "created_by": admin_user,
+    }
+    campaigns = [
+        LocationCampaign(
+            status=LocationCampaign.Status.DRAFT,
+            customizations={"discount_percentage": 25},
+            generated_content="",
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.PENDING_REVIEW,
+            customizations={"discount_percentage": 30},
+            generated_content="Summer Sale at Downtown Store!",
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.APPROVED,
+            customizations={"discount_percentage": 35},
+            generated_content="Approved campaign content",
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.REJECTED,
+            customizations={"discount_percentage": 15},
+            generated_content="Rejected content",
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.SCHEDULED,
+            customizations={"discount_percentage": 40},
+            generated_content="Scheduled campaign content",
+            scheduled_start=now + timedelta(days=1),
+            scheduled_end=now + timedelta(days=7),
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.ACTIVE,
+            customizations={"discount_percentage": 50},
+            generated_content="Active campaign content",
+            scheduled_start=now - timedelta(days=1),
+            scheduled_end=now + timedelta(days=6),
+            **common,
+        ),
+        LocationCampaign(
+            status=LocationCampaign.Status.COMPLETED,
+            customizations={"discount_percentage": 20},
+            generated_content="Completed campaign content",
+            scheduled_start=now - timedelta(days=14),
+            scheduled_end=now - timedelta(days=7),
+            **common,
+        ),
+    ]
+    LocationCampaign.objects.bulk_create(campaigns)
+    states = {campaign.status: campaign for campaign in campaigns}
+    states["approval_step"] = ApprovalStep.objects.bulk_create(
+        [
+            ApprovalStep(
+                campaign=states[LocationCampaign.Status.PENDING_REVIEW],
+                approver=admin_user,
+                decision=ApprovalStep.Decision.SUBMITTED,
+                comments="Submitting for review",
+                previous_status=LocationCampaign.Status.DRAFT,
+                new_status=LocationCampaign.Status.PENDING_REVIEW,
+            )
+        ]
+    )[0]
+    return states
 
 
 # =============================================================================